@@ -563,15 +563,15 @@ class MemorySummarizer:
                 # Delete from vector store (Qdrant)
                 if self.vector_store.use_qdrant and self.vector_store.qdrant_client:
                     try:
-                        import qdrant_client
+                        from qdrant_client.http import models
                         
                         # Delete from Qdrant in batches
                         for i in range(0, len(memory_ids), 100):
                             batch = memory_ids[i:i+100]
                             
-                            self.vector_store.qdrant_client.delete(
+                            await self.vector_store.qdrant_client.delete(
                                 collection_name=self.vector_store.collection_name,
-                                points_selector=qdrant_client.http.models.PointIdsList(
+                                points_selector=models.PointIdsList(
                                     points=batch
                                 )
                             )
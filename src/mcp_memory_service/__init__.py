@@ -3,7 +3,7 @@
 __version__ = "0.1.0"
 
 from .models import Memory, MemoryQueryResult
-from .storage import MemoryStorage, ChromaMemoryStorage
+from .storage import MemoryStorage
 from .utils import generate_content_hash
 
 __all__ = [
@@ -14,3 +14,9 @@ __all__ = [
     'generate_content_hash'
 ]
 
+def __getattr__(name):
+    # Defer the ChromaDB backend (and its heavy dependencies) until first use
+    if name == 'ChromaMemoryStorage':
+        from .storage.chroma import ChromaMemoryStorage
+        return ChromaMemoryStorage
+    raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
@@ -154,3 +154,10 @@ COLLECTION_METADATA = {
     "hnsw:construction_ef": 100,  # Increased for better accuracy
     "hnsw:search_ef": 100        # Increased for better search results
 }
+
+# Retrieve result cache settings (0 disables the cache)
+RETRIEVE_CACHE_SIZE = int(os.getenv('RETRIEVE_CACHE_SIZE', '256'))
+RETRIEVE_CACHE_TTL_SECONDS = float(os.getenv('RETRIEVE_CACHE_TTL_SECONDS', '300'))
+
+# Indent JSON tool results for human readers; compact output is smaller for machine consumers
+PRETTY_JSON = os.getenv('MCP_MEMORY_PRETTY_JSON', '').lower() in ('1', 'true', 'yes')
@@ -109,22 +109,29 @@ class Memory:
         
         # Update legacy timestamp field for backward compatibility
         self.timestamp = datetime.utcfromtimestamp(self.created_at)
+        self._synced_timestamps = self._timestamp_fields()
+
+    def _timestamp_fields(self) -> tuple:
+        """Return the current timestamp fields, used to detect changes since the last sync."""
+        return (self.created_at, self.created_at_iso, self.updated_at, self.updated_at_iso)
 
     def touch(self):
         """Update the updated_at timestamps to the current time."""
         now = time.time()
         self.updated_at = now
         self.updated_at_iso = datetime.utcfromtimestamp(now).isoformat() + "Z"
+        self._synced_timestamps = self._timestamp_fields()
 
     def to_dict(self) -> Dict[str, Any]:
         """Convert memory to dictionary format for storage."""
-        # Ensure timestamps are synchronized
-        self._sync_timestamps(
-            created_at=self.created_at,
-            created_at_iso=self.created_at_iso,
-            updated_at=self.updated_at,
-            updated_at_iso=self.updated_at_iso
-        )
+        # Ensure timestamps are synchronized; skip re-parsing the ISO strings if nothing changed
+        if getattr(self, "_synced_timestamps", None) != self._timestamp_fields():
+            self._sync_timestamps(
+                created_at=self.created_at,
+                created_at_iso=self.created_at_iso,
+                updated_at=self.updated_at,
+                updated_at_iso=self.updated_at_iso
+            )
         
         return {
             "content": self.content,
@@ -16,6 +16,7 @@ import traceback
 import argparse
 import json
 import platform
+import signal
 from typing import List, Dict, Any, Optional, Tuple
 from datetime import datetime, timedelta
 from .utils.utils import ensure_datetime
@@ -30,11 +31,15 @@ from .config import (
     CHROMA_PATH,
     BACKUPS_PATH,
     SERVER_NAME,
-    SERVER_VERSION
+    SERVER_VERSION,
+    RETRIEVE_CACHE_SIZE,
+    RETRIEVE_CACHE_TTL_SECONDS,
+    PRETTY_JSON
 )
 from .storage.chroma import ChromaMemoryStorage
-from .models.memory import Memory
+from .models.memory import Memory, MemoryQueryResult
 from .utils.hashing import generate_content_hash
+from .utils.query_cache import QueryCache
 from .utils.system_detection import (
     get_system_info,
     print_system_diagnostics,
@@ -42,6 +47,18 @@ from .utils.system_detection import (
 )
 from .utils.time_parser import extract_time_expression, parse_time_expression
 
+try:
+    import orjson
+    ORJSON_AVAILABLE = True
+except ImportError:
+    ORJSON_AVAILABLE = False
+
+try:
+    import uvloop
+    UVLOOP_AVAILABLE = True
+except ImportError:
+    UVLOOP_AVAILABLE = False
+
 # Configure logging to go to stderr
 log_level = os.getenv('LOG_LEVEL', 'ERROR').upper()
 logging.basicConfig(
@@ -51,6 +68,20 @@ logging.basicConfig(
 )
 logger = logging.getLogger(__name__)
 
+def dumps_json(obj: Any) -> str:
+    """Serialize a tool result as JSON, using orjson when it is installed.
+    
+    Output is compact unless MCP_MEMORY_PRETTY_JSON is set.
+    """
+    if ORJSON_AVAILABLE:
+        option = orjson.OPT_NON_STR_KEYS | orjson.OPT_SERIALIZE_NUMPY
+        if PRETTY_JSON:
+            option |= orjson.OPT_INDENT_2
+        return orjson.dumps(obj, option=option).decode("utf-8")
+    if PRETTY_JSON:
+        return json.dumps(obj, indent=2)
+    return json.dumps(obj, separators=(",", ":"))
+
 # Check if UV is being used
 def check_uv_environment():
     """Check if UV is being used and provide recommendations if not."""
@@ -108,6 +139,8 @@ class MemoryServer:
         """Initialize the server with hardware-aware configuration."""
         self.server = Server(SERVER_NAME)
         self.system_info = get_system_info()
+        # Results of retrieve_memory, keyed by normalized query; cleared on every write
+        self.query_cache = QueryCache(maxsize=RETRIEVE_CACHE_SIZE, ttl=RETRIEVE_CACHE_TTL_SECONDS)
         
         try:
             # Initialize paths
@@ -145,13 +178,15 @@ class MemoryServer:
             # Run any async initialization tasks here
             logger.info("Starting async initialization...")
             
-            # Print system diagnostics to stderr for visibility
-            print("\n=== System Diagnostics ===", file=sys.stderr, flush=True)
-            print(f"OS: {self.system_info.os_name} {self.system_info.os_version}", file=sys.stderr, flush=True)
-            print(f"Architecture: {self.system_info.architecture}", file=sys.stderr, flush=True)
-            print(f"Memory: {self.system_info.memory_gb:.2f} GB", file=sys.stderr, flush=True)
-            print(f"Accelerator: {self.system_info.accelerator}", file=sys.stderr, flush=True)
-            print(f"Python: {platform.python_version()}", file=sys.stderr, flush=True)
+            # Print system diagnostics to stderr for visibility (single write and flush)
+            print("\n".join([
+                "\n=== System Diagnostics ===",
+                f"OS: {self.system_info.os_name} {self.system_info.os_version}",
+                f"Architecture: {self.system_info.architecture}",
+                f"Memory: {self.system_info.memory_gb:.2f} GB",
+                f"Accelerator: {self.system_info.accelerator}",
+                f"Python: {platform.python_version()}"
+            ]), file=sys.stderr, flush=True)
             
             # Validate database health with timeout
             try:
@@ -246,8 +281,7 @@ class MemoryServer:
         # Add a custom error handler for unsupported methods
         self.server.on_method_not_found = self.handle_method_not_found
         
-        @self.server.list_tools()
-        async def handle_list_tools() -> List[types.Tool]:
+        def build_tools() -> List[types.Tool]:
             return [
                 types.Tool(
                     name="store_memory",
@@ -303,6 +337,46 @@ class MemoryServer:
                         "required": ["content"]
                     }
                 ),
+                types.Tool(
+                    name="store_memories",
+                    description="""Store several memories in one call.
+
+                    Each item takes the same content and metadata as store_memory.
+                    Use this instead of repeated store_memory calls when saving many
+                    memories at once, so they can be written as a batch.
+
+                    Example:
+                    {
+                        "memories": [
+                            {"content": "First memory", "metadata": {"tags": "project,notes"}},
+                            {"content": "Second memory", "metadata": {"type": "fact"}}
+                        ]
+                    }""",
+                    inputSchema={
+                        "type": "object",
+                        "properties": {
+                            "memories": {
+                                "type": "array",
+                                "description": "Memories to store, each with content and optional metadata.",
+                                "items": {
+                                    "type": "object",
+                                    "properties": {
+                                        "content": {
+                                            "type": "string",
+                                            "description": "The memory content to store."
+                                        },
+                                        "metadata": {
+                                            "type": "object",
+                                            "description": "Optional metadata about the memory, including tags and type."
+                                        }
+                                    },
+                                    "required": ["content"]
+                                }
+                            }
+                        },
+                        "required": ["memories"]
+                    }
+                ),
                 types.Tool(
                     name="recall_memory",
                     description="""Retrieve memories using natural language time expressions and optional semantic search.
@@ -364,6 +438,35 @@ class MemoryServer:
                         "required": ["query"]
                     }
                 ),
+                types.Tool(
+                    name="retrieve_memories",
+                    description="""Find relevant memories for several queries in one call.
+
+                    Use this instead of repeated retrieve_memory calls when looking up
+                    several topics at once, so the searches can be sent as a batch.
+
+                    Example:
+                    {
+                        "queries": ["project deadlines", "database settings"],
+                        "n_results": 5
+                    }""",
+                    inputSchema={
+                        "type": "object",
+                        "properties": {
+                            "queries": {
+                                "type": "array",
+                                "items": {"type": "string"},
+                                "description": "Search queries to find relevant memories for."
+                            },
+                            "n_results": {
+                                "type": "number",
+                                "default": 5,
+                                "description": "Maximum number of results to return per query."
+                            }
+                        },
+                        "required": ["queries"]
+                    }
+                ),
                 types.Tool(
                     name="search_by_tag",
                     description="""Search memories by tags. Must use array format.
@@ -602,6 +705,34 @@ class MemoryServer:
                 )
             ]
         
+        # Tool definitions are static, so build them once instead of on every list_tools call
+        tools = build_tools()
+        
+        @self.server.list_tools()
+        async def handle_list_tools() -> List[types.Tool]:
+            return tools
+        
+        # Map tool names to their handlers for a single dict lookup per call
+        tool_handlers = {
+            "store_memory": self.handle_store_memory,
+            "store_memories": self.handle_store_memories,
+            "retrieve_memory": self.handle_retrieve_memory,
+            "retrieve_memories": self.handle_retrieve_memories,
+            "recall_memory": self.handle_recall_memory,
+            "search_by_tag": self.handle_search_by_tag,
+            "delete_memory": self.handle_delete_memory,
+            "delete_by_tag": self.handle_delete_by_tag,
+            "cleanup_duplicates": self.handle_cleanup_duplicates,
+            "get_embedding": self.handle_get_embedding,
+            "check_embedding_model": self.handle_check_embedding_model,
+            "debug_retrieve": self.handle_debug_retrieve,
+            "exact_match_retrieve": self.handle_exact_match_retrieve,
+            "check_database_health": self.handle_check_database_health,
+            "recall_by_timeframe": self.handle_recall_by_timeframe,
+            "delete_by_timeframe": self.handle_delete_by_timeframe,
+            "delete_before_date": self.handle_delete_before_date,
+        }
+        
         @self.server.call_tool()
         async def handle_call_tool(name: str, arguments: dict | None) -> List[types.TextContent]:
             try:
@@ -609,38 +740,10 @@ class MemoryServer:
                 if arguments is None:
                     arguments = {}
                 
-                if name == "store_memory":
-                    return await self.handle_store_memory(arguments)
-                elif name == "retrieve_memory":
-                    return await self.handle_retrieve_memory(arguments)
-                elif name == "recall_memory":
-                    return await self.handle_recall_memory(arguments)
-                elif name == "search_by_tag":
-                    return await self.handle_search_by_tag(arguments)
-                elif name == "delete_memory":
-                    return await self.handle_delete_memory(arguments)
-                elif name == "delete_by_tag":
-                    return await self.handle_delete_by_tag(arguments)
-                elif name == "cleanup_duplicates":
-                    return await self.handle_cleanup_duplicates(arguments)
-                elif name == "get_embedding":
-                    return await self.handle_get_embedding(arguments)
-                elif name == "check_embedding_model":
-                    return await self.handle_check_embedding_model(arguments)
-                elif name == "debug_retrieve":
-                    return await self.handle_debug_retrieve(arguments)
-                elif name == "exact_match_retrieve":
-                    return await self.handle_exact_match_retrieve(arguments)
-                elif name == "check_database_health":
-                    return await self.handle_check_database_health(arguments)
-                elif name == "recall_by_timeframe":
-                    return await self.handle_recall_by_timeframe(arguments)
-                elif name == "delete_by_timeframe":
-                    return await self.handle_delete_by_timeframe(arguments)
-                elif name == "delete_before_date":
-                    return await self.handle_delete_before_date(arguments)
-                else:
+                handler = tool_handlers.get(name)
+                if handler is None:
                     raise ValueError(f"Unknown tool: {name}")
+                return await handler(arguments)
             except Exception as e:
                 logger.error(f"Error in {name}: {str(e)}\n{traceback.format_exc()}")
                 return [types.TextContent(type="text", text=f"Error: {str(e)}")]
@@ -665,6 +768,29 @@ class MemoryServer:
         else:
             logger.info(f"Database validation successful: {message}")
 
+    def build_memory(self, content: str, metadata: Dict[str, Any]) -> Memory:
+        """Create a Memory from tool call content and metadata."""
+        # Normalize tags to a list
+        tags = metadata.get("tags", "")
+        if isinstance(tags, str):
+            tags = [tag.strip() for tag in tags.split(",") if tag.strip()]
+        else:
+            tags = []  # If tags is not a string, default to empty list to be consistent with the Memory Model
+
+        sanitized_tags = self.storage.sanitized(tags)
+        
+        # Create memory object
+        content_hash = generate_content_hash(content, metadata)
+        now = time.time()
+        return Memory(
+            content=content,
+            content_hash=content_hash,
+            tags=tags,  # keep as a list for easier use in other methods
+            memory_type=metadata.get("type"),
+            metadata = {**metadata, "tags":sanitized_tags},  # include the stringified tags in the meta data
+            created_at=now  # Memory derives created_at_iso from this without re-parsing
+        )
+
     async def handle_store_memory(self, arguments: dict) -> List[types.TextContent]:
         content = arguments.get("content")
         metadata = arguments.get("metadata", {})
@@ -673,34 +799,58 @@ class MemoryServer:
             return [types.TextContent(type="text", text="Error: Content is required")]
         
         try:
-            # Normalize tags to a list
-            tags = metadata.get("tags", "")
-            if isinstance(tags, str):
-                tags = [tag.strip() for tag in tags.split(",") if tag.strip()]
-            else:
-                tags = []  # If tags is not a string, default to empty list to be consistent with the Memory Model
-
-            sanitized_tags = self.storage.sanitized(tags)
-            
-            # Create memory object
-            content_hash = generate_content_hash(content, metadata)
-            now = time.time()
-            memory = Memory(
-                content=content,
-                content_hash=content_hash,
-                tags=tags,  # keep as a list for easier use in other methods
-                memory_type=metadata.get("type"),
-                metadata = {**metadata, "tags":sanitized_tags},  # include the stringified tags in the meta data
-                created_at=now,
-                created_at_iso=datetime.utcfromtimestamp(now).isoformat() + "Z"
-            )
+            memory = self.build_memory(content, metadata)
             
             # Store memory
             success, message = await self.storage.store(memory)
+            self.query_cache.clear()
             return [types.TextContent(type="text", text=message)]
         except Exception as e:
             logger.error(f"Error storing memory: {str(e)}\n{traceback.format_exc()}")
             return [types.TextContent(type="text", text=f"Error storing memory: {str(e)}")]
+
+    async def handle_store_memories(self, arguments: dict) -> List[types.TextContent]:
+        items = arguments.get("memories") or []
+        
+        if not items:
+            return [types.TextContent(type="text", text="Error: At least one memory is required")]
+        if any(not item.get("content") for item in items):
+            return [types.TextContent(type="text", text="Error: Content is required for every memory")]
+        
+        try:
+            memories = [self.build_memory(item["content"], item.get("metadata", {})) for item in items]
+            
+            # Store all memories in one batch
+            results = await self.storage.store_batch(memories)
+            self.query_cache.clear()
+            
+            stored = sum(1 for success, _ in results if success)
+            lines = [f"Stored {stored} of {len(results)} memories"]
+            lines.extend(message for _, message in results)
+            return [types.TextContent(type="text", text="\n".join(lines))]
+        except Exception as e:
+            logger.error(f"Error storing memories: {str(e)}\n{traceback.format_exc()}")
+            return [types.TextContent(type="text", text=f"Error storing memories: {str(e)}")]
+    
+    def format_retrieve_results(self, results: List[MemoryQueryResult]) -> str:
+        """Format semantic search results the way retrieve_memory reports them."""
+        formatted_results = [
+            "\
+".join([
+                f"Memory {i+1}:",
+                f"Content: {result.memory.content}",
+                f"Hash: {result.memory.content_hash}",
+                f"Relevance Score: {result.relevance_score:.2f}",
+                *([f"Tags: {', '.join(result.memory.tags)}"] if result.memory.tags else []),
+                "---"
+            ])
+            for i, result in enumerate(results)
+        ]
+        
+        return ("Found the following memories:\
+\
+" + "\
+".join(formatted_results))
     
     async def handle_retrieve_memory(self, arguments: dict) -> List[types.TextContent]:
         query = arguments.get("query")
@@ -710,36 +860,56 @@ class MemoryServer:
             return [types.TextContent(type="text", text="Error: Query is required")]
         
         try:
-            results = await self.storage.retrieve(query, n_results)
+            cache_key = (QueryCache.normalize_query(query), n_results)
+            results = self.query_cache.get(cache_key)
+            if results is None:
+                results = await self.storage.retrieve(query, n_results)
+                # Storage backends return [] on transient errors too, so never cache a miss
+                if results:
+                    self.query_cache.put(cache_key, results)
             
             if not results:
                 return [types.TextContent(type="text", text="No matching memories found")]
             
-            formatted_results = []
-            for i, result in enumerate(results):
-                memory_info = [
-                    f"Memory {i+1}:",
-                    f"Content: {result.memory.content}",
-                    f"Hash: {result.memory.content_hash}",
-                    f"Relevance Score: {result.relevance_score:.2f}"
-                ]
-                if result.memory.tags:
-                    memory_info.append(f"Tags: {', '.join(result.memory.tags)}")
-                memory_info.append("---")
-                formatted_results.append("\
-".join(memory_info))
-            
-            return [types.TextContent(
-                type="text",
-                text="Found the following memories:\
-\
-" + "\
-".join(formatted_results)
-            )]
+            return [types.TextContent(type="text", text=self.format_retrieve_results(results))]
         except Exception as e:
             logger.error(f"Error retrieving memories: {str(e)}\
 {traceback.format_exc()}")
             return [types.TextContent(type="text", text=f"Error retrieving memories: {str(e)}")]
+    
+    async def handle_retrieve_memories(self, arguments: dict) -> List[types.TextContent]:
+        queries = arguments.get("queries") or []
+        n_results = arguments.get("n_results", 5)
+        
+        if not queries:
+            return [types.TextContent(type="text", text="Error: At least one query is required")]
+        if any(not query for query in queries):
+            return [types.TextContent(type="text", text="Error: Every query must be non-empty")]
+        
+        try:
+            cache_keys = [(QueryCache.normalize_query(query), n_results) for query in queries]
+            results_by_query = [self.query_cache.get(cache_key) for cache_key in cache_keys]
+            
+            # Send every uncached query to storage as one batch
+            missing = [i for i, results in enumerate(results_by_query) if results is None]
+            if missing:
+                fetched = await self.storage.retrieve_batch([queries[i] for i in missing], n_results)
+                for i, results in zip(missing, fetched):
+                    results_by_query[i] = results
+                    # Storage backends return [] on transient errors too, so never cache a miss
+                    if results:
+                        self.query_cache.put(cache_keys[i], results)
+            
+            sections = [
+                f"Results for query: {query}\n" + (
+                    self.format_retrieve_results(results) if results else "No matching memories found"
+                )
+                for query, results in zip(queries, results_by_query)
+            ]
+            return [types.TextContent(type="text", text="\n\n".join(sections))]
+        except Exception as e:
+            logger.error(f"Error retrieving memories: {str(e)}\n{traceback.format_exc()}")
+            return [types.TextContent(type="text", text=f"Error retrieving memories: {str(e)}")]
 
     async def handle_search_by_tag(self, arguments: dict) -> List[types.TextContent]:
         tags = arguments.get("tags", [])
@@ -756,18 +926,17 @@ class MemoryServer:
                     text=f"No memories found with tags: {', '.join(tags)}"
                 )]
             
-            formatted_results = []
-            for i, memory in enumerate(memories):
-                memory_info = [
+            formatted_results = [
+                "\n".join([
                     f"Memory {i+1}:",
                     f"Content: {memory.content}",
                     f"Hash: {memory.content_hash}",
-                    f"Tags: {', '.join(memory.tags)}"
-                ]
-                if memory.memory_type:
-                    memory_info.append(f"Type: {memory.memory_type}")
-                memory_info.append("---")
-                formatted_results.append("\n".join(memory_info))
+                    f"Tags: {', '.join(memory.tags)}",
+                    *([f"Type: {memory.memory_type}"] if memory.memory_type else []),
+                    "---"
+                ])
+                for i, memory in enumerate(memories)
+            ]
             
             return [types.TextContent(
                 type="text",
@@ -780,15 +949,18 @@ class MemoryServer:
     async def handle_delete_memory(self, arguments: dict) -> List[types.TextContent]:
         content_hash = arguments.get("content_hash")
         success, message = await self.storage.delete(content_hash)
+        self.query_cache.clear()
         return [types.TextContent(type="text", text=message)]
 
     async def handle_delete_by_tag(self, arguments: dict) -> List[types.TextContent]:
         tag = arguments.get("tag")
         count, message = await self.storage.delete_by_tag(tag)
+        self.query_cache.clear()
         return [types.TextContent(type="text", text=message)]
 
     async def handle_cleanup_duplicates(self, arguments: dict) -> List[types.TextContent]:
         count, message = await self.storage.cleanup_duplicates()
+        self.query_cache.clear()
         return [types.TextContent(type="text", text=message)]
 
     async def handle_get_embedding(self, arguments: dict) -> List[types.TextContent]:
@@ -802,7 +974,7 @@ class MemoryServer:
             return [types.TextContent(
                 type="text",
                 text=f"Embedding results:\
-{json.dumps(result, indent=2)}"
+{dumps_json(result)}"
             )]
         except Exception as e:
             return [types.TextContent(type="text", text=f"Error getting embedding: {str(e)}")]
@@ -814,7 +986,7 @@ class MemoryServer:
             return [types.TextContent(
                 type="text",
                 text=f"Embedding model status:\
-{json.dumps(result, indent=2)}"
+{dumps_json(result)}"
             )]
         except Exception as e:
             return [types.TextContent(type="text", text=f"Error checking model: {str(e)}")]
@@ -1021,7 +1193,7 @@ class MemoryServer:
             
             return [types.TextContent(
                 type="text",
-                text=f"Database Health Check Results:\n{json.dumps(result, indent=2)}"
+                text=f"Database Health Check Results:\n{dumps_json(result)}"
             )]
         except Exception as e:
             return [types.TextContent(
@@ -1101,6 +1273,7 @@ class MemoryServer:
             tag = arguments.get("tag")
             
             count, message = await self.storage.delete_by_timeframe(start_date, end_date, tag)
+            self.query_cache.clear()
             return [types.TextContent(
                 type="text",
                 text=f"Deleted {count} memories: {message}"
@@ -1121,6 +1294,7 @@ class MemoryServer:
             tag = arguments.get("tag")
             
             count, message = await self.storage.delete_before_date(before_date, tag)
+            self.query_cache.clear()
             return [types.TextContent(
                 type="text",
                 text=f"Deleted {count} memories: {message}"
@@ -1162,20 +1336,23 @@ async def async_main():
     global CHROMA_PATH
     CHROMA_PATH = args.chroma_path
     
-    # Print system diagnostics to console
+    # Print system diagnostics to console (single write and flush)
     system_info = get_system_info()
-    print("\n=== MCP Memory Service System Diagnostics ===", file=sys.stderr, flush=True)
-    print(f"OS: {system_info.os_name} {system_info.architecture}", file=sys.stderr, flush=True)
-    print(f"Python: {platform.python_version()}", file=sys.stderr, flush=True)
-    print(f"Hardware Acceleration: {system_info.accelerator}", file=sys.stderr, flush=True)
-    print(f"Memory: {system_info.memory_gb:.2f} GB", file=sys.stderr, flush=True)
-    print(f"Optimal Model: {system_info.get_optimal_model()}", file=sys.stderr, flush=True)
-    print(f"Optimal Batch Size: {system_info.get_optimal_batch_size()}", file=sys.stderr, flush=True)
-    print(f"ChromaDB Path: {CHROMA_PATH}", file=sys.stderr, flush=True)
-    print("================================================\n", file=sys.stderr, flush=True)
+    print("\n".join([
+        "\n=== MCP Memory Service System Diagnostics ===",
+        f"OS: {system_info.os_name} {system_info.architecture}",
+        f"Python: {platform.python_version()}",
+        f"Hardware Acceleration: {system_info.accelerator}",
+        f"Memory: {system_info.memory_gb:.2f} GB",
+        f"Optimal Model: {system_info.get_optimal_model()}",
+        f"Optimal Batch Size: {system_info.get_optimal_batch_size()}",
+        f"ChromaDB Path: {CHROMA_PATH}",
+        "================================================\n"
+    ]), file=sys.stderr, flush=True)
     
     logger.info(f"Starting MCP Memory Service with ChromaDB path: {CHROMA_PATH}")
     
+    memory_server = None
     try:
         # Create server instance with hardware-aware configuration
         memory_server = MemoryServer()
@@ -1241,10 +1418,26 @@ async def async_main():
         logger.error(traceback.format_exc())
         print(f"Fatal server error: {str(e)}", file=sys.stderr, flush=True)
         raise
+    finally:
+        # Flush queued writes and release storage connections on shutdown
+        if memory_server is not None:
+            await memory_server.storage.close()
 
 def main():
+    # Treat SIGTERM like Ctrl+C so the loop cancels pending tasks and closes connections
+    if hasattr(signal, "SIGTERM"):
+        signal.signal(signal.SIGTERM, signal.default_int_handler)
+    
     try:
-        asyncio.run(async_main())
+        # Prefer uvloop's libuv-based event loop when it is installed (POSIX only)
+        if sys.version_info >= (3, 11):
+            loop_factory = uvloop.new_event_loop if UVLOOP_AVAILABLE else None
+            with asyncio.Runner(loop_factory=loop_factory) as runner:
+                runner.run(async_main())
+        else:
+            if UVLOOP_AVAILABLE:
+                asyncio.set_event_loop_policy(uvloop.EventLoopPolicy())
+            asyncio.run(async_main())
     except KeyboardInterrupt:
         logger.info("Shutting down gracefully...")
     except Exception as e:
@@ -1,4 +1,10 @@
 from .base import MemoryStorage
-from .chroma import ChromaMemoryStorage
 
-__all__ = ['MemoryStorage', 'ChromaMemoryStorage']
\ No newline at end of file
+__all__ = ['MemoryStorage', 'ChromaMemoryStorage']
+
+def __getattr__(name):
+    # Import the ChromaDB backend lazily; it pulls in chromadb and sentence-transformers
+    if name == 'ChromaMemoryStorage':
+        from .chroma import ChromaMemoryStorage
+        return ChromaMemoryStorage
+    raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
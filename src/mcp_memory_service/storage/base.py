@@ -15,11 +15,35 @@ class MemoryStorage(ABC):
         """Store a memory. Returns (success, message)."""
         pass
     
+    async def store_batch(self, memories: List[Memory]) -> List[Tuple[bool, str]]:
+        """
+        Store several memories. Returns one (success, message) per memory, in order.
+        
+        The default stores them one at a time; backends that can batch writes should override it.
+        """
+        return [await self.store(memory) for memory in memories]
+    
+    async def close(self) -> None:
+        """
+        Flush pending writes and release connections on shutdown.
+        
+        The default does nothing; backends holding pools or background tasks should override it.
+        """
+        pass
+    
     @abstractmethod
     async def retrieve(self, query: str, n_results: int = 5) -> List[MemoryQueryResult]:
         """Retrieve memories by semantic search."""
         pass
     
+    async def retrieve_batch(self, queries: List[str], n_results: int = 5) -> List[List[MemoryQueryResult]]:
+        """
+        Retrieve memories for several queries. Returns one result list per query, in order.
+        
+        The default runs the queries one at a time; backends that can batch searches should override it.
+        """
+        return [await self.retrieve(query, n_results) for query in queries]
+    
     @abstractmethod
     async def search_by_tag(self, tags: List[str]) -> List[Memory]:
         """Search memories by tags."""
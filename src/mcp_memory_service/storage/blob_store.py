@@ -8,6 +8,7 @@ with functionality for generating presigned URLs.
 """
 
 import os
+import asyncio
 import logging
 import time
 import hashlib
@@ -30,6 +31,7 @@ class BlobStoreClient:
         self.r2_bucket = os.environ.get("R2_BUCKET")
         self.blob_threshold = int(os.environ.get("BLOB_THRESHOLD", "32768"))  # 32 KB default
         self.url_expiry = int(os.environ.get("PRESIGN_EXPIRY_SECONDS", "3600"))  # 1 hour default
+        self.max_pool_connections = int(os.environ.get("R2_MAX_POOL_CONNECTIONS", "32"))
         self.client = None
         self._is_initialized = False
     
@@ -52,12 +54,17 @@ class BlobStoreClient:
                 endpoint_url=self.r2_endpoint,
                 aws_access_key_id=self.r2_access_key,
                 aws_secret_access_key=self.r2_secret_key,
-                config=Config(signature_version='s3v4')
+                config=Config(
+                    signature_version='s3v4',
+                    # Reuse warm TLS connections across concurrent blob operations
+                    max_pool_connections=self.max_pool_connections,
+                    tcp_keepalive=True
+                )
             )
             
             # Verify bucket exists
             try:
-                self.client.head_bucket(Bucket=self.r2_bucket)
+                await asyncio.to_thread(self.client.head_bucket, Bucket=self.r2_bucket)
                 logger.info(f"Connected to R2 bucket: {self.r2_bucket}")
                 self._is_initialized = True
             except Exception as e:
@@ -78,13 +85,19 @@ class BlobStoreClient:
         """
         return self._is_initialized and self.client is not None
     
-    async def save_if_large(self, content: str, content_hash: str) -> Tuple[str, Optional[str]]:
+    async def save_if_large(
+        self,
+        content: str,
+        content_hash: str,
+        content_bytes: Optional[bytes] = None
+    ) -> Tuple[str, Optional[str]]:
         """
         Save content to blob storage if it exceeds the size threshold.
         
         Args:
             content: Content to potentially store in blob storage
             content_hash: Hash identifier for the content
+            content_bytes: UTF-8 encoding of content, if the caller already has it
             
         Returns:
             Tuple of (content, payload_url) where payload_url is None if content is stored inline
@@ -94,17 +107,22 @@ class BlobStoreClient:
             if not self.is_configured():
                 return content, None
         
+        # Encode once; the same bytes are used for the size check and the upload
+        if content_bytes is None:
+            content_bytes = content.encode('utf-8')
+        
         # Check if content exceeds the threshold
-        if len(content.encode('utf-8')) <= self.blob_threshold:
+        if len(content_bytes) <= self.blob_threshold:
             return content, None
         
         try:
             # Generate a key for the blob
             key = f"memories/{content_hash}.txt"
             
-            # Upload the blob
-            self.client.upload_fileobj(
-                BytesIO(content.encode('utf-8')),
+            # Upload the blob in a worker thread so the event loop stays responsive
+            await asyncio.to_thread(
+                self.client.upload_fileobj,
+                BytesIO(content_bytes),
                 self.r2_bucket,
                 key,
                 ExtraArgs={'ContentType': 'text/plain; charset=utf-8'}
@@ -178,14 +196,16 @@ class BlobStoreClient:
                 return None
         
         try:
-            # Get the object from R2
-            response = self.client.get_object(
-                Bucket=self.r2_bucket,
-                Key=key
-            )
+            # Get the object from R2 and read the body off the event loop
+            def _download() -> bytes:
+                response = self.client.get_object(
+                    Bucket=self.r2_bucket,
+                    Key=key
+                )
+                return response['Body'].read()
             
-            # Read and decode the content
-            content = response['Body'].read().decode('utf-8')
+            # Decode the content
+            content = (await asyncio.to_thread(_download)).decode('utf-8')
             
             return content
             
@@ -210,7 +230,8 @@ class BlobStoreClient:
         
         try:
             # Delete the object from R2
-            self.client.delete_object(
+            await asyncio.to_thread(
+                self.client.delete_object,
                 Bucket=self.r2_bucket,
                 Key=key
             )
@@ -249,7 +270,8 @@ class BlobStoreClient:
                 objects = [{'Key': key} for key in batch]
                 
                 # Delete the objects
-                self.client.delete_objects(
+                await asyncio.to_thread(
+                    self.client.delete_objects,
                     Bucket=self.r2_bucket,
                     Delete={
                         'Objects': objects,
@@ -21,6 +21,7 @@ from datetime import datetime, date
 from .base import MemoryStorage
 from ..models.memory import Memory, MemoryQueryResult
 from ..utils.hashing import generate_content_hash
+from ..utils.query_cache import QueryCache
 from ..utils.system_detection import (
     get_system_info,
     get_optimal_embedding_settings,
@@ -52,6 +53,11 @@ class ChromaMemoryStorage(MemoryStorage):
         self.collection = None
         self.system_info = get_system_info()
         self.embedding_settings = get_optimal_embedding_settings()
+        # Embeddings are deterministic per query string, so they never need to expire
+        self._query_embeddings = QueryCache(
+            maxsize=int(os.environ.get("QUERY_EMBEDDING_CACHE_SIZE", "1024")),
+            ttl=float("inf")
+        )
         
         # Log system information
         logger.info(f"Detected system: {self.system_info.os_name} {self.system_info.architecture}")
@@ -108,7 +114,7 @@ class ChromaMemoryStorage(MemoryStorage):
         for model_name in models_to_try:
             try:
                 logger.info(f"Attempting to load model: {model_name} on {device}")
-                start_time = time.time()
+                start_time = time.perf_counter()
                 
                 # Try to initialize the model with the current settings
                 self.model = SentenceTransformer(
@@ -122,7 +128,7 @@ class ChromaMemoryStorage(MemoryStorage):
                 # Test the model with a simple encoding
                 _ = self.model.encode("Test encoding", batch_size=batch_size)
                 
-                load_time = time.time() - start_time
+                load_time = time.perf_counter() - start_time
                 logger.info(f"Successfully loaded model {model_name} in {load_time:.2f}s")
                 
                 # Create embedding function for ChromaDB
@@ -181,6 +187,24 @@ class ChromaMemoryStorage(MemoryStorage):
         except Exception as e:
             logger.error(f"Failed to create minimal embedding function: {str(e)}")
 
+    def _embed_query(self, query: str) -> List[float]:
+        """
+        Embed a query string with the collection's embedding function, reusing cached vectors.
+        
+        Args:
+            query: Query string
+            
+        Returns:
+            Query embedding
+        """
+        embedding = self._query_embeddings.get(query)
+        if embedding is None:
+            embedding = self.embedding_function([query])[0]
+            if hasattr(embedding, "tolist"):
+                embedding = embedding.tolist()
+            self._query_embeddings.put(query, embedding)
+        return embedding
+    
     def sanitized(self, tags):
         if tags is None:
             return json.dumps([])
@@ -416,8 +440,13 @@ class ChromaMemoryStorage(MemoryStorage):
             if query:
                 # Combined semantic search with time filtering
                 try:
+                    # Reuse cached query embeddings; fall back to Chroma's own embedder if ours failed to load
+                    if self.embedding_function is not None:
+                        query_args = {"query_embeddings": [self._embed_query(query)]}
+                    else:
+                        query_args = {"query_texts": [query]}
                     results = self.collection.query(
-                        query_texts=[query],
+                        **query_args,
                         n_results=n_results,
                         where=where_clause,
                         include=["documents", "metadatas", "distances"]
@@ -639,12 +668,12 @@ class ChromaMemoryStorage(MemoryStorage):
                 logger.error("Embedding function not initialized, cannot retrieve memories")
                 return []
             
-            start_time = time.time()
+            start_time = time.perf_counter()
             
             try:
-                # Query using the embedding function with hardware-aware settings
+                # Query with the (cached) embedding from the collection's embedding function
                 results = self.collection.query(
-                    query_texts=[query],
+                    query_embeddings=[self._embed_query(query)],
                     n_results=n_results,
                     include=["documents", "metadatas", "distances"]
                 )
@@ -676,7 +705,7 @@ class ChromaMemoryStorage(MemoryStorage):
                     logger.error(f"Fallback query also failed: {str(fallback_error)}")
                     return []
             
-            query_time = time.time() - start_time
+            query_time = time.perf_counter() - start_time
             logger.debug(f"Query completed in {query_time:.4f}s")
             
             if not results["ids"] or not results["ids"][0]:
@@ -34,9 +34,20 @@ class EchoVaultStorage(MemoryStorage):
         """Initialize the EchoVault storage."""
         self.path = path
         self.neon_client = NeonClient()
-        self.vector_store = VectorStoreClient()
+        # Share one Neon connection pool with the vector store
+        self.vector_store = VectorStoreClient(neon_client=self.neon_client)
         self.blob_store = BlobStoreClient()
-        self.model = None  # Will be initialized on demand
+        # R2 is only needed for large content, so it is connected on first use
+        self._blob_store_checked = False
+        self._blob_store_lock = asyncio.Lock()
+        self.model = None  # Local encoder, set only if a backend client exposes one
+        self._generate_embedding = None  # Vector store embedding fallback, resolved in initialize()
+        # Optional micro-batching: concurrent store() calls are coalesced into store_batch()
+        self._store_batching = os.environ.get("STORE_BATCHING", "").lower() in ("true", "1", "yes")
+        self._store_batch_size = int(os.environ.get("STORE_BATCH_SIZE", "64"))
+        self._store_batch_wait = float(os.environ.get("STORE_BATCH_MAX_WAIT_MS", "50")) / 1000
+        self._store_queue: Optional[asyncio.Queue] = None
+        self._store_flusher: Optional[asyncio.Task] = None
         self._is_initialized = False
         
         # Initialize OpenTelemetry and Prometheus metrics
@@ -48,10 +59,11 @@ class EchoVaultStorage(MemoryStorage):
             return
         
         try:
-            # Initialize clients
-            await self.neon_client.initialize()
-            await self.vector_store.initialize()
-            await self.blob_store.initialize()
+            # Initialize clients concurrently; the shared Neon pool is only created once
+            await asyncio.gather(
+                self.neon_client.initialize(),
+                self.vector_store.initialize()
+            )
             
             # Get embedding model from vector store if available
             if hasattr(self.vector_store, "model") and self.vector_store.model:
@@ -59,12 +71,49 @@ class EchoVaultStorage(MemoryStorage):
             elif hasattr(self.neon_client, "model") and self.neon_client.model:
                 self.model = self.neon_client.model
             
+            # Resolve the embedding fallback once rather than probing on every query
+            self._generate_embedding = getattr(self.vector_store, "_generate_embedding", None)
+            
             self._is_initialized = True
             logger.info("EchoVault storage initialized successfully")
         except Exception as e:
             logger.error(f"Failed to initialize EchoVault storage: {e}")
             raise
     
+    async def _blob_store_ready(self) -> bool:
+        """
+        Initialize blob storage on first use.
+        
+        Returns:
+            True if blob storage is configured and reachable
+        """
+        if not self._blob_store_checked:
+            async with self._blob_store_lock:
+                if not self._blob_store_checked:
+                    await self.blob_store.initialize()
+                    self._blob_store_checked = True
+        return self.blob_store.is_configured()
+    
+    async def _fetch_blob_contents(self, payload_urls: List[Optional[str]]) -> List[Optional[str]]:
+        """
+        Fetch offloaded contents from blob storage concurrently.
+        
+        Args:
+            payload_urls: Blob keys, with None for memories stored inline
+            
+        Returns:
+            Full contents in the same order, None where nothing was fetched
+        """
+        if not any(payload_urls) or not await self._blob_store_ready():
+            return [None] * len(payload_urls)
+        
+        async def fetch(payload_url: Optional[str]) -> Optional[str]:
+            if not payload_url:
+                return None
+            return await self.blob_store.retrieve_content(payload_url)
+        
+        return await asyncio.gather(*(fetch(url) for url in payload_urls))
+    
     @otel_prom.trace_async("store_memory")
     async def store(self, memory: Memory) -> Tuple[bool, str]:
         """
@@ -79,39 +128,19 @@ class EchoVaultStorage(MemoryStorage):
         if not self._is_initialized:
             await self.initialize()
         
-        start_time = time.time()
+        if self._store_batching:
+            return await self._enqueue_store(memory)
+        
+        start_time = time.perf_counter_ns()
         
         try:
-            # Generate embedding if not provided
-            if not memory.embedding and self.model:
-                memory.embedding = self.model.encode(memory.content).tolist()
-            
-            # Check if content should be stored in blob storage
-            content_length = len(memory.content.encode('utf-8'))
-            original_content = memory.content
-            payload_url = None
-            
-            if self.blob_store.is_configured() and content_length > self.blob_store.blob_threshold:
-                # Store content in blob storage
-                memory.content, payload_url = await self.blob_store.save_if_large(memory.content, memory.content_hash)
+            point, content_length, payload_url = await self._prepare_point(memory)
             
             # Store in vector store
-            await self.vector_store.upsert(
-                id=memory.content_hash,
-                content=original_content,  # Always use original content for embedding
-                embedding=memory.embedding,
-                metadata={
-                    "content_hash": memory.content_hash,
-                    "memory_type": memory.memory_type if memory.memory_type else "",
-                    "tags": memory.tags,
-                    "timestamp": int(memory.timestamp.timestamp()) if hasattr(memory.timestamp, "timestamp") else int(time.time()),
-                    "payload_url": payload_url,
-                    **memory.metadata
-                }
-            )
+            await self.vector_store.upsert(**point)
             
             # Record telemetry
-            duration_ms = (time.time() - start_time) * 1000
+            duration_ms = (time.perf_counter_ns() - start_time) / 1e6
             otel_prom.trace_write(
                 content_length=content_length,
                 has_payload_url=payload_url is not None,
@@ -123,6 +152,277 @@ class EchoVaultStorage(MemoryStorage):
             logger.error(f"Failed to store memory: {e}")
             return False, f"Failed to store memory: {e}"
     
+    async def store_batch(self, memories: List[Memory]) -> List[Tuple[bool, str]]:
+        """
+        Store several memories with a single vector store upsert.
+        
+        Args:
+            memories: Memories to store
+            
+        Returns:
+            List of (success, message) tuples in the same order as memories
+        """
+        if not memories:
+            return []
+        
+        if not self._is_initialized:
+            await self.initialize()
+        
+        try:
+            # Embed every memory that still needs a vector in one batched forward pass.
+            # Neither backend client exposes a model yet, so callers must supply embeddings.
+            pending = [memory for memory in memories if not memory.embedding]
+            if pending and self.model:
+                embeddings = await asyncio.to_thread(
+                    self.model.encode,
+                    [memory.content for memory in pending],
+                    batch_size=32,
+                    convert_to_numpy=True
+                )
+                # One tolist() over the whole matrix instead of one per row
+                for memory, embedding in zip(pending, embeddings.tolist()):
+                    memory.embedding = embedding
+            
+            # Offload large contents concurrently, then write every point in one batch
+            prepared = await asyncio.gather(*(self._prepare_point(memory) for memory in memories))
+            success = await self.vector_store.upsert_batch([point for point, _, _ in prepared])
+        except Exception as e:
+            logger.error(f"Failed to store memories: {e}")
+            return [(False, f"Failed to store memory: {e}")] * len(memories)
+        
+        if not success:
+            return [(False, f"Failed to store memory {memory.content_hash}") for memory in memories]
+        
+        for memory, (_, content_length, payload_url) in zip(memories, prepared):
+            otel_prom.trace_write(
+                content_length=content_length,
+                has_payload_url=payload_url is not None,
+                tags_count=len(memory.tags)
+            )
+        
+        return [(True, f"Successfully stored memory {memory.content_hash}") for memory in memories]
+    
+    async def _enqueue_store(self, memory: Memory) -> Tuple[bool, str]:
+        """
+        Queue a memory for the background batch writer and wait for its result.
+        
+        Args:
+            memory: Memory to store
+            
+        Returns:
+            Tuple of (success, message)
+        """
+        loop = asyncio.get_running_loop()
+        if (self._store_flusher is None or self._store_flusher.done()
+                or self._store_flusher.get_loop() is not loop):
+            # A writer from a finished run or another event loop will never drain its queue
+            if self._store_queue is not None:
+                self._fail_queued_stores(self._store_queue, RuntimeError("Store batch writer was restarted"))
+            self._store_queue = asyncio.Queue()
+            self._store_flusher = asyncio.create_task(self._flush_stores(self._store_queue))
+        
+        future = loop.create_future()
+        await self._store_queue.put((memory, future))
+        return await future
+    
+    async def _flush_stores(self, queue: asyncio.Queue):
+        """Drain queued stores in batches of up to STORE_BATCH_SIZE, waiting at most STORE_BATCH_MAX_WAIT_MS."""
+        loop = asyncio.get_running_loop()
+        batch = []
+        try:
+            while True:
+                batch = [await queue.get()]
+                deadline = loop.time() + self._store_batch_wait
+                while len(batch) < self._store_batch_size:
+                    timeout = deadline - loop.time()
+                    if timeout <= 0:
+                        break
+                    try:
+                        batch.append(await asyncio.wait_for(queue.get(), timeout))
+                    except asyncio.TimeoutError:
+                        break
+                
+                try:
+                    results = await self.store_batch([memory for memory, _ in batch])
+                except Exception as e:
+                    logger.error(f"Failed to store memory batch: {e}")
+                    results = [(False, f"Failed to store memory: {e}")] * len(batch)
+                
+                for (_, future), result in zip(batch, results):
+                    if not future.done():
+                        future.set_result(result)
+                    queue.task_done()
+                batch = []
+        finally:
+            # Never leave a caller waiting on a write that will not happen
+            error = RuntimeError("Store batch writer stopped before the memory was written")
+            for _, future in batch:
+                if not future.done():
+                    future.set_exception(error)
+            self._fail_queued_stores(queue, error)
+    
+    @staticmethod
+    def _fail_queued_stores(queue: asyncio.Queue, error: Exception):
+        """Resolve every store still waiting in a queue with an error."""
+        while not queue.empty():
+            _, future = queue.get_nowait()
+            if not future.done():
+                try:
+                    future.set_exception(error)
+                except RuntimeError:
+                    # The future's event loop is already closed; nobody is waiting on it
+                    pass
+    
+    async def close(self):
+        """Flush queued stores, stop the batch writer and close all connections."""
+        flusher, queue = self._store_flusher, self._store_queue
+        self._store_flusher = self._store_queue = None
+        if flusher is not None:
+            if flusher.get_loop() is asyncio.get_running_loop():
+                if not flusher.done():
+                    # Let the writer finish everything already queued before stopping it
+                    drained = asyncio.ensure_future(queue.join())
+                    await asyncio.wait({drained, flusher}, return_when=asyncio.FIRST_COMPLETED)
+                    drained.cancel()
+                flusher.cancel()
+                try:
+                    await flusher
+                except asyncio.CancelledError:
+                    pass
+            else:
+                # The writer belongs to an event loop that can no longer run it
+                self._fail_queued_stores(queue, RuntimeError("Store batch writer stopped before the memory was written"))
+        
+        await self.vector_store.close()
+        await self.neon_client.close()
+        self._is_initialized = False
+    
+    async def _prepare_point(self, memory: Memory) -> Tuple[Dict[str, Any], int, Optional[str]]:
+        """
+        Embed a memory and offload large content to blob storage.
+        
+        Args:
+            memory: Memory to prepare
+            
+        Returns:
+            Tuple of (upsert keyword arguments, content length in bytes, payload_url)
+        """
+        # Generate embedding if not provided
+        if not memory.embedding and self.model:
+            memory.embedding = (await asyncio.to_thread(
+                self.model.encode, memory.content
+            )).tolist()
+        
+        # Check if content should be stored in blob storage; the encoded bytes are
+        # handed to the blob store so large payloads are only encoded once
+        content_bytes = memory.content.encode('utf-8')
+        content_length = len(content_bytes)
+        original_content = memory.content
+        payload_url = None
+        
+        if content_length > self.blob_store.blob_threshold and await self._blob_store_ready():
+            # Store content in blob storage
+            memory.content, payload_url = await self.blob_store.save_if_large(
+                memory.content, memory.content_hash, content_bytes=content_bytes
+            )
+        
+        point = {
+            "id": memory.content_hash,
+            "content": original_content,  # Always use original content for embedding
+            "embedding": memory.embedding,
+            "metadata": {
+                "content_hash": memory.content_hash,
+                "memory_type": memory.memory_type if memory.memory_type else "",
+                "tags": memory.tags,
+                "timestamp": int(memory.timestamp.timestamp()) if hasattr(memory.timestamp, "timestamp") else int(time.time()),
+                "payload_url": payload_url,
+                **memory.metadata
+            }
+        }
+        return point, content_length, payload_url
+    
+    async def _embed_query(self, query: str) -> Optional[List[float]]:
+        """
+        Embed a query string.
+        
+        Args:
+            query: Query string
+            
+        Returns:
+            Query embedding, or None if no embedding model is available
+        """
+        if self.model:
+            return (await asyncio.to_thread(
+                self.model.encode, query
+            )).tolist()
+        
+        # Fallback - try to use vector store's embedding method
+        if self._generate_embedding is not None:
+            return await self._generate_embedding(query)
+        
+        logger.error("No embedding model available")
+        return None
+    
+    async def _to_query_results(self, results: List[Dict[str, Any]]) -> List[MemoryQueryResult]:
+        """
+        Convert vector store search results into memory query results.
+        
+        Args:
+            results: Result dicts from the vector store
+            
+        Returns:
+            List of memory query results
+        """
+        # Reconstruct offloaded content, fetching all blobs concurrently
+        blob_contents = await self._fetch_blob_contents(
+            [result.get("metadata", {}).get("payload_url") for result in results]
+        )
+        
+        # Convert to MemoryQueryResult
+        memory_results = []
+        for result, full_content in zip(results, blob_contents):
+            content = full_content or result["content"]
+            
+            # Extract metadata and tags
+            metadata = result.get("metadata", {})
+            
+            if "tags" in metadata:
+                tags = metadata.pop("tags")
+                if isinstance(tags, str):
+                    try:
+                        tags = json.loads(tags)
+                    except json.JSONDecodeError:
+                        tags = [tag.strip() for tag in tags.split(",") if tag.strip()]
+            else:
+                tags = []
+            
+            if "memory_type" in metadata:
+                memory_type = metadata.pop("memory_type")
+            else:
+                memory_type = ""
+            
+            if "content_hash" in metadata:
+                content_hash = metadata.pop("content_hash")
+            else:
+                content_hash = result.get("id", "")
+            
+            # Create memory object
+            memory = Memory(
+                content=content,
+                content_hash=content_hash,
+                tags=tags,
+                memory_type=memory_type,
+                metadata=metadata
+            )
+            
+            # Add to results
+            memory_results.append(MemoryQueryResult(
+                memory=memory,
+                relevance_score=result.get("similarity", 0.0)
+            ))
+        
+        return memory_results
+    
     @otel_prom.trace_async("retrieve_memory")
     async def retrieve(self, query: str, n_results: int = 5) -> List[MemoryQueryResult]:
         """
@@ -138,19 +438,13 @@ class EchoVaultStorage(MemoryStorage):
         if not self._is_initialized:
             await self.initialize()
         
-        start_time = time.time()
+        start_time = time.perf_counter_ns()
         
         try:
             # Generate query embedding
-            if self.model:
-                query_embedding = self.model.encode(query).tolist()
-            else:
-                # Fallback - try to use vector store's embedding method
-                if hasattr(self.vector_store, "_generate_embedding"):
-                    query_embedding = await self.vector_store._generate_embedding(query)
-                else:
-                    logger.error("No embedding model available")
-                    return []
+            query_embedding = await self._embed_query(query)
+            if query_embedding is None:
+                return []
             
             # Search in vector store
             results = await self.vector_store.search(
@@ -159,59 +453,10 @@ class EchoVaultStorage(MemoryStorage):
                 similarity_threshold=0.0  # Return all results, we'll filter later
             )
             
-            # Convert to MemoryQueryResult
-            memory_results = []
-            for result in results:
-                # Reconstruct content if needed
-                content = result["content"]
-                payload_url = result.get("metadata", {}).get("payload_url")
-                
-                if payload_url and self.blob_store.is_configured():
-                    # Retrieve full content from blob storage
-                    full_content = await self.blob_store.retrieve_content(payload_url)
-                    if full_content:
-                        content = full_content
-                
-                # Extract metadata and tags
-                metadata = result.get("metadata", {})
-                
-                if "tags" in metadata:
-                    tags = metadata.pop("tags")
-                    if isinstance(tags, str):
-                        try:
-                            tags = json.loads(tags)
-                        except json.JSONDecodeError:
-                            tags = [tag.strip() for tag in tags.split(",") if tag.strip()]
-                else:
-                    tags = []
-                
-                if "memory_type" in metadata:
-                    memory_type = metadata.pop("memory_type")
-                else:
-                    memory_type = ""
-                
-                if "content_hash" in metadata:
-                    content_hash = metadata.pop("content_hash")
-                else:
-                    content_hash = result.get("id", "")
-                
-                # Create memory object
-                memory = Memory(
-                    content=content,
-                    content_hash=content_hash,
-                    tags=tags,
-                    memory_type=memory_type,
-                    metadata=metadata
-                )
-                
-                # Add to results
-                memory_results.append(MemoryQueryResult(
-                    memory=memory,
-                    relevance_score=result.get("similarity", 0.0)
-                ))
+            memory_results = await self._to_query_results(results)
             
             # Record telemetry
-            duration_ms = (time.time() - start_time) * 1000
+            duration_ms = (time.perf_counter_ns() - start_time) / 1e6
             otel_prom.trace_read(
                 latency_ms=duration_ms,
                 results_count=len(memory_results)
@@ -222,6 +467,57 @@ class EchoVaultStorage(MemoryStorage):
             logger.error(f"Failed to retrieve memories: {e}")
             return []
     
+    @otel_prom.trace_async("retrieve_memory_batch")
+    async def retrieve_batch(self, queries: List[str], n_results: int = 5) -> List[List[MemoryQueryResult]]:
+        """
+        Retrieve memories for several queries with one vector store search request.
+        
+        Args:
+            queries: Query strings for semantic search
+            n_results: Maximum number of results to return per query
+            
+        Returns:
+            One list of memory query results per query, in the same order as queries
+        """
+        if not queries:
+            return []
+        
+        if not self._is_initialized:
+            await self.initialize()
+        
+        start_time = time.perf_counter_ns()
+        
+        try:
+            # Embed all queries in one pass when a local model is available
+            if self.model:
+                query_embeddings = (await asyncio.to_thread(
+                    self.model.encode, queries
+                )).tolist()
+            else:
+                query_embeddings = await asyncio.gather(*(self._embed_query(query) for query in queries))
+                if any(embedding is None for embedding in query_embeddings):
+                    return [[] for _ in queries]
+            
+            batch_results = await self.vector_store.search_batch(
+                embeddings=query_embeddings,
+                limit=n_results,
+                similarity_threshold=0.0  # Return all results, we'll filter later
+            )
+            
+            memory_results = await asyncio.gather(*(self._to_query_results(results) for results in batch_results))
+            
+            # Record telemetry
+            duration_ms = (time.perf_counter_ns() - start_time) / 1e6
+            otel_prom.trace_read(
+                latency_ms=duration_ms,
+                results_count=sum(len(results) for results in memory_results)
+            )
+            
+            return list(memory_results)
+        except Exception as e:
+            logger.error(f"Failed to retrieve memories: {e}")
+            return [[] for _ in queries]
+    
     @otel_prom.trace_async("search_by_tag")
     async def search_by_tag(self, tags: List[str]) -> List[Memory]:
         """
@@ -240,18 +536,15 @@ class EchoVaultStorage(MemoryStorage):
             # Search by tag in Neon
             results = await self.neon_client.search_by_tags(tags)
             
+            # Retrieve offloaded content from blob storage concurrently
+            blob_contents = await self._fetch_blob_contents(
+                [result.get("payload_url") for result in results]
+            )
+            
             # Convert to Memory objects
             memories = []
-            for result in results:
-                # Check if content should be retrieved from blob storage
-                content = result["content"]
-                payload_url = result.get("payload_url")
-                
-                if payload_url and self.blob_store.is_configured():
-                    # Retrieve full content from blob storage
-                    full_content = await self.blob_store.retrieve_content(payload_url)
-                    if full_content:
-                        content = full_content
+            for result, full_content in zip(results, blob_contents):
+                content = full_content or result["content"]
                 
                 # Create Memory object
                 memory = Memory(
@@ -296,7 +589,7 @@ class EchoVaultStorage(MemoryStorage):
             success = await self.vector_store.delete(content_hash)
             
             # Delete from blob storage if needed
-            if payload_url and self.blob_store.is_configured():
+            if payload_url and await self._blob_store_ready():
                 await self.blob_store.delete_blob(payload_url)
             
             if success:
@@ -345,31 +638,36 @@ class EchoVaultStorage(MemoryStorage):
             await self.initialize()
         
         try:
-            # Get all memories
-            async with self.neon_client.pool.acquire() as conn:
-                # Find duplicates by content
-                rows = await conn.fetch("""
-                    WITH duplicates AS (
+            # Page through duplicate groups by content instead of holding a cursor open.
+            # Each page's connection is released before the deletes run, since they
+            # acquire pool connections of their own and would starve a small pool.
+            page_size = self.neon_client.cursor_prefetch
+            last_content = None
+            total_groups = 0
+            total_deleted = 0
+            while True:
+                async with self.neon_client.pool.acquire() as conn:
+                    # Find duplicates by content
+                    rows = await conn.fetch("""
                         SELECT 
                             content, 
                             array_agg(content_hash) AS content_hashes,
                             array_agg(payload_url) AS payload_urls
                         FROM 
                             memories
+                        WHERE 
+                            $1::text IS NULL OR content > $1
                         GROUP BY 
                             content
                         HAVING 
                             COUNT(*) > 1
-                    )
-                    SELECT content_hashes, payload_urls FROM duplicates
-                """)
-                
-                if not rows:
-                    return 0, "No duplicate memories found"
+                        ORDER BY 
+                            content
+                        LIMIT $2
+                    """, last_content, page_size)
                 
-                # Process each set of duplicates
-                total_deleted = 0
                 for row in rows:
+                    total_groups += 1
                     content_hashes = row["content_hashes"]
                     payload_urls = row["payload_urls"]
                     
@@ -383,14 +681,21 @@ class EchoVaultStorage(MemoryStorage):
                     
                     # Delete duplicate blobs if any
                     payload_urls = [url for url in payload_urls if url]
-                    if len(payload_urls) > 1 and self.blob_store.is_configured():
+                    if len(payload_urls) > 1 and await self._blob_store_ready():
                         # Keep the first URL, delete the rest
                         delete_urls = payload_urls[1:]
                         await self.blob_store.batch_delete_blobs(delete_urls)
                     
                     total_deleted += len(delete_hashes)
                 
-                return total_deleted, f"Successfully removed {total_deleted} duplicate memories"
+                if len(rows) < page_size:
+                    break
+                last_content = rows[-1]["content"]
+            
+            if not total_groups:
+                return 0, "No duplicate memories found"
+            
+            return total_deleted, f"Successfully removed {total_deleted} duplicate memories"
         except Exception as e:
             logger.error(f"Failed to cleanup duplicates: {e}")
             return 0, f"Failed to cleanup duplicates: {e}"
\ No newline at end of file
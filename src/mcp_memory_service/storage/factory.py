@@ -12,10 +12,14 @@ import logging
 from typing import Optional
 
 from .base import MemoryStorage
-from .chroma import ChromaMemoryStorage
 
 logger = logging.getLogger(__name__)
 
+def _create_chroma_storage(path: Optional[str]) -> MemoryStorage:
+    """Create the ChromaDB storage, importing chromadb only when it is actually used."""
+    from .chroma import ChromaMemoryStorage
+    return ChromaMemoryStorage(path)
+
 def create_storage(path: Optional[str] = None) -> MemoryStorage:
     """
     Create a storage implementation based on environment configuration.
@@ -38,11 +42,11 @@ def create_storage(path: Optional[str] = None) -> MemoryStorage:
         except ImportError as e:
             logger.warning(f"Failed to import EchoVaultStorage: {e}")
             logger.warning("Falling back to ChromaMemoryStorage")
-            return ChromaMemoryStorage(path)
+            return _create_chroma_storage(path)
         except Exception as e:
             logger.error(f"Error initializing EchoVaultStorage: {e}")
             logger.warning("Falling back to ChromaMemoryStorage")
-            return ChromaMemoryStorage(path)
+            return _create_chroma_storage(path)
     else:
         logger.info("Using standard ChromaMemoryStorage")
-        return ChromaMemoryStorage(path)
\ No newline at end of file
+        return _create_chroma_storage(path)
\ No newline at end of file
@@ -18,6 +18,20 @@ from asyncpg.pool import Pool
 
 logger = logging.getLogger(__name__)
 
+INSERT_MEMORY_SQL = """
+    INSERT INTO memories(
+        id, content, embedding, tags, timestamp, 
+        content_hash, memory_type, metadata, payload_url
+    )
+    VALUES($1, $2, $3, $4, $5, $6, $7, $8, $9)
+    ON CONFLICT(content_hash) DO NOTHING
+"""
+
+INSERT_TELEMETRY_SQL = """
+    INSERT INTO telemetry(event_type, event_data)
+    VALUES($1, $2)
+"""
+
 class NeonClient:
     """
     Client for Neon PostgreSQL with pgvector support.
@@ -29,6 +43,10 @@ class NeonClient:
         self.pool = None
         self.dsn = os.environ.get("NEON_DSN")
         self.pool_size = int(os.environ.get("NEON_POOL_SIZE", "5"))
+        # Rows fetched per round trip when streaming large result sets through a cursor
+        self.cursor_prefetch = int(os.environ.get("NEON_CURSOR_PREFETCH", "1000"))
+        # A shared client may be initialized by several owners concurrently
+        self._init_lock = asyncio.Lock()
         self._is_initialized = False
     
     async def initialize(self):
@@ -39,26 +57,30 @@ class NeonClient:
         if not self.dsn:
             logger.error("NEON_DSN environment variable is not set")
             raise ValueError("NEON_DSN environment variable is not set")
+        
+        async with self._init_lock:
+            if self._is_initialized:
+                return
             
-        try:
-            # Create connection pool
-            logger.info(f"Creating connection pool with {self.pool_size} connections")
-            self.pool = await asyncpg.create_pool(
-                dsn=self.dsn,
-                min_size=1,
-                max_size=self.pool_size,
-                command_timeout=30,
-                setup=self._setup_connection
-            )
-            
-            # Initialize database schema if needed
-            await self._init_schema()
-            
-            self._is_initialized = True
-            logger.info("Neon client initialized successfully")
-        except Exception as e:
-            logger.error(f"Failed to initialize Neon client: {e}")
-            raise
+            try:
+                # Create connection pool
+                logger.info(f"Creating connection pool with {self.pool_size} connections")
+                self.pool = await asyncpg.create_pool(
+                    dsn=self.dsn,
+                    min_size=1,
+                    max_size=self.pool_size,
+                    command_timeout=30,
+                    setup=self._setup_connection
+                )
+                
+                # Initialize database schema if needed
+                await self._init_schema()
+                
+                self._is_initialized = True
+                logger.info("Neon client initialized successfully")
+            except Exception as e:
+                logger.error(f"Failed to initialize Neon client: {e}")
+                raise
     
     async def _setup_connection(self, connection: asyncpg.Connection):
         """Set up connection with vector extension."""
@@ -169,14 +191,7 @@ class NeonClient:
         async with self.pool.acquire() as conn:
             try:
                 # Insert into memories table
-                await conn.execute("""
-                    INSERT INTO memories(
-                        id, content, embedding, tags, timestamp, 
-                        content_hash, memory_type, metadata, payload_url
-                    )
-                    VALUES($1, $2, $3, $4, $5, $6, $7, $8, $9)
-                    ON CONFLICT(content_hash) DO NOTHING
-                """, 
+                await conn.execute(INSERT_MEMORY_SQL,
                 content_hash,  # Using content_hash as ID
                 content,
                 embedding,
@@ -189,10 +204,7 @@ class NeonClient:
                 )
                 
                 # Record telemetry
-                await conn.execute("""
-                    INSERT INTO telemetry(event_type, event_data)
-                    VALUES($1, $2)
-                """,
+                await conn.execute(INSERT_TELEMETRY_SQL,
                 "memory_insert",
                 {
                     "content_hash": content_hash,
@@ -207,6 +219,60 @@ class NeonClient:
                 logger.error(f"Failed to insert memory event: {e}")
                 raise
     
+    async def insert_events(self, events: List[Dict[str, Any]]) -> bool:
+        """
+        Insert several memory events in one transaction.
+        
+        Args:
+            events: Dicts with the same keys as the insert_event arguments
+            
+        Returns:
+            True if insertion was successful
+        """
+        if not events:
+            return True
+        
+        if not self._is_initialized:
+            await self.initialize()
+        
+        memory_rows = []
+        telemetry_rows = []
+        for event in events:
+            tags = event.get("tags", [])
+            payload_url = event.get("payload_url")
+            memory_rows.append((
+                event["content_hash"],  # Using content_hash as ID
+                event["content"],
+                event["embedding"],
+                json.dumps(tags) if isinstance(tags, list) else tags,
+                event.get("timestamp"),
+                event["content_hash"],
+                event.get("memory_type") or "",
+                event.get("metadata") or {},
+                payload_url
+            ))
+            telemetry_rows.append((
+                "memory_insert",
+                {
+                    "content_hash": event["content_hash"],
+                    "memory_type": event.get("memory_type"),
+                    "tags_count": len(tags) if isinstance(tags, list) else 0,
+                    "has_payload_url": payload_url is not None,
+                    "content_length": len(event["content"])
+                }
+            ))
+        
+        async with self.pool.acquire() as conn:
+            try:
+                async with conn.transaction():
+                    await conn.executemany(INSERT_MEMORY_SQL, memory_rows)
+                    await conn.executemany(INSERT_TELEMETRY_SQL, telemetry_rows)
+                
+                return True
+            except Exception as e:
+                logger.error(f"Failed to insert memory events: {e}")
+                raise
+    
     async def search_by_vector(self, 
                              embedding: List[float], 
                              limit: int = 5,
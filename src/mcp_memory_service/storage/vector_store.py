@@ -9,22 +9,58 @@ with a fallback to pgvector or ChromaDB.
 
 import os
 import json
+import random
 import logging
-from typing import List, Dict, Any, Optional, Tuple, Union
+import asyncio
+from contextlib import asynccontextmanager
+from typing import List, Dict, Any, Optional, Tuple, Union, Callable, Awaitable
 
 logger = logging.getLogger(__name__)
 
+# Import Qdrant conditionally to avoid hard dependencies
+try:
+    from qdrant_client import AsyncQdrantClient
+    from qdrant_client.http import models
+    from qdrant_client.http.exceptions import UnexpectedResponse
+    QDRANT_AVAILABLE = True
+except ImportError:
+    QDRANT_AVAILABLE = False
+
 class VectorStoreClient:
     """
     Client for vector stores with support for Qdrant and pgvector.
     Provides a unified interface for vector operations.
     """
     
-    def __init__(self):
-        """Initialize the vector store client."""
+    def __init__(self, neon_client=None, qdrant_client=None):
+        """
+        Initialize the vector store client.
+        
+        Args:
+            neon_client: Optional NeonClient to share instead of opening a second pool
+            qdrant_client: Optional AsyncQdrantClient to share instead of opening a new connection
+        """
         self.use_qdrant = os.environ.get("USE_QDRANT", "").lower() in ("true", "1", "yes")
-        self.qdrant_client = None
-        self.neon_client = None
+        self.qdrant_client = qdrant_client
+        self._owns_qdrant_client = qdrant_client is None
+        # gRPC has lower per-call overhead than REST; needs the gRPC port reachable
+        self.qdrant_prefer_grpc = os.environ.get("QDRANT_PREFER_GRPC", "").lower() in ("true", "1", "yes")
+        self.qdrant_grpc_port = int(os.environ.get("QDRANT_GRPC_PORT", "6334"))
+        # Lower ef visits fewer HNSW nodes per query, trading a little recall for latency
+        self.hnsw_ef = int(os.environ.get("QDRANT_HNSW_EF", "64"))
+        # Batches at least this large pause HNSW indexing until the upload finishes
+        self.bulk_upsert_threshold = int(os.environ.get("QDRANT_BULK_UPSERT_THRESHOLD", "1000"))
+        # Restored after a bulk load when the collection reports no explicit threshold
+        self.default_indexing_threshold = int(os.environ.get("QDRANT_INDEXING_THRESHOLD", "20000"))
+        # Overlapping bulk loads share one pause; the last one out restores indexing
+        self._indexing_pause_lock = asyncio.Lock()
+        self._indexing_pauses = 0
+        self._saved_indexing_threshold = None
+        # Short timeouts plus a few quick retries fail fast on a degraded Qdrant
+        self.qdrant_timeout = int(os.environ.get("QDRANT_TIMEOUT", "5"))
+        self.qdrant_max_retries = int(os.environ.get("QDRANT_MAX_RETRIES", "2"))
+        self.neon_client = neon_client
+        self._owns_neon_client = neon_client is None
         self.collection_name = "memories"
         self._is_initialized = False
     
@@ -34,57 +70,8 @@ class VectorStoreClient:
             return
             
         try:
-            # Initialize Neon client for fallback
-            try:
-                from .neon_client import NeonClient
-                self.neon_client = NeonClient()
-                await self.neon_client.initialize()
-                logger.info("Initialized Neon client for vector operations")
-            except ImportError:
-                logger.warning("NeonClient not available, pgvector operations will not be supported")
-            except Exception as e:
-                logger.error(f"Failed to initialize Neon client: {e}")
-            
-            # Initialize Qdrant client if enabled
-            if self.use_qdrant:
-                try:
-                    import qdrant_client
-                    from qdrant_client import QdrantClient
-                    from qdrant_client.http import models
-                    
-                    qdrant_url = os.environ.get("QDRANT_URL")
-                    qdrant_api_key = os.environ.get("QDRANT_API_KEY")
-                    
-                    if not qdrant_url:
-                        logger.error("QDRANT_URL environment variable is not set")
-                        self.use_qdrant = False
-                    else:
-                        # Connect to Qdrant
-                        self.qdrant_client = QdrantClient(
-                            url=qdrant_url,
-                            api_key=qdrant_api_key
-                        )
-                        
-                        # Create collection if it doesn't exist
-                        collections = self.qdrant_client.get_collections().collections
-                        collection_names = [c.name for c in collections]
-                        
-                        if self.collection_name not in collection_names:
-                            self.qdrant_client.create_collection(
-                                collection_name=self.collection_name,
-                                vectors_config=models.VectorParams(
-                                    size=1536,  # OpenAI ada-002 embedding size
-                                    distance=models.Distance.COSINE
-                                )
-                            )
-                        
-                        logger.info(f"Initialized Qdrant client at {qdrant_url}")
-                except ImportError:
-                    logger.warning("Qdrant client not available, falling back to pgvector")
-                    self.use_qdrant = False
-                except Exception as e:
-                    logger.error(f"Failed to initialize Qdrant client: {e}")
-                    self.use_qdrant = False
+            # Neon and Qdrant are independent, so connect to both concurrently
+            await asyncio.gather(self._init_neon(), self._init_qdrant())
             
             self._is_initialized = True
             
@@ -92,13 +79,89 @@ class VectorStoreClient:
             logger.error(f"Failed to initialize vector store client: {e}")
             raise
     
+    async def _init_neon(self):
+        """Initialize the Neon client used for pgvector fallback."""
+        try:
+            if self.neon_client is None:
+                from .neon_client import NeonClient
+                self.neon_client = NeonClient()
+            await self.neon_client.initialize()
+            logger.info("Initialized Neon client for vector operations")
+        except ImportError:
+            logger.warning("NeonClient not available, pgvector operations will not be supported")
+        except Exception as e:
+            logger.error(f"Failed to initialize Neon client: {e}")
+    
+    async def _init_qdrant(self):
+        """Connect to Qdrant and create the collection if it doesn't exist."""
+        if self.use_qdrant and not QDRANT_AVAILABLE:
+            logger.warning("Qdrant client not available, falling back to pgvector")
+            self.use_qdrant = False
+        
+        if self.use_qdrant:
+            try:
+                qdrant_url = os.environ.get("QDRANT_URL")
+                qdrant_api_key = os.environ.get("QDRANT_API_KEY")
+                
+                if not qdrant_url:
+                    logger.error("QDRANT_URL environment variable is not set")
+                    self.use_qdrant = False
+                else:
+                    # Connect to Qdrant unless a client was shared with us
+                    if self.qdrant_client is None:
+                        self.qdrant_client = AsyncQdrantClient(
+                            url=qdrant_url,
+                            api_key=qdrant_api_key,
+                            prefer_grpc=self.qdrant_prefer_grpc,
+                            grpc_port=self.qdrant_grpc_port,
+                            timeout=self.qdrant_timeout
+                        )
+                    
+                    # Create collection if it doesn't exist (server-side lookup, no full listing)
+                    if not await self.qdrant_client.collection_exists(self.collection_name):
+                        await self.qdrant_client.create_collection(
+                            collection_name=self.collection_name,
+                            vectors_config=models.VectorParams(
+                                size=1536,  # OpenAI ada-002 embedding size
+                                distance=models.Distance.COSINE,
+                                on_disk=True  # Originals are only read to rescore top candidates
+                            ),
+                            # int8 copies in RAM cut the search working set 4x
+                            quantization_config=models.ScalarQuantization(
+                                scalar=models.ScalarQuantizationConfig(
+                                    type=models.ScalarType.INT8,
+                                    always_ram=True
+                                )
+                            ),
+                            # One segment per core lets a single query search segments in parallel
+                            optimizers_config=models.OptimizersConfigDiff(
+                                default_segment_number=os.cpu_count() or 8
+                            )
+                        )
+                    
+                    # Keyword index so tag filters are indexed lookups instead of payload scans
+                    try:
+                        await self.qdrant_client.create_payload_index(
+                            collection_name=self.collection_name,
+                            field_name="tags",
+                            field_schema=models.PayloadSchemaType.KEYWORD
+                        )
+                    except Exception as e:
+                        logger.warning(f"Failed to create Qdrant tags index: {e}")
+                    
+                    logger.info(f"Initialized Qdrant client at {qdrant_url}")
+            except Exception as e:
+                logger.error(f"Failed to initialize Qdrant client: {e}")
+                self.use_qdrant = False
+    
     async def close(self):
         """Close connections to vector stores."""
-        if self.neon_client:
+        # A shared Neon client is closed by its owner
+        if self.neon_client and self._owns_neon_client:
             await self.neon_client.close()
         
-        if self.qdrant_client:
-            self.qdrant_client.close()
+        if self.qdrant_client and self._owns_qdrant_client:
+            await self.qdrant_client.close()
         
         self._is_initialized = False
     
@@ -119,78 +182,177 @@ class VectorStoreClient:
         Returns:
             True if the operation was successful
         """
+        return await self.upsert_batch([{
+            "id": id,
+            "content": content,
+            "embedding": embedding,
+            "metadata": metadata
+        }])
+    
+    async def upsert_batch(self, points: List[Dict[str, Any]]) -> bool:
+        """
+        Insert or update several vectors with one request per store.
+        
+        Args:
+            points: Dicts with the same id, content, embedding and metadata keys as upsert
+            
+        Returns:
+            True if the operation was successful
+        """
+        if not points:
+            return True
+        
         if not self._is_initialized:
             await self.initialize()
         
-        success = True
+        # Qdrant and Neon writes are independent, so issue them concurrently
+        qdrant_success, neon_success = await asyncio.gather(
+            self._upsert_qdrant(points),
+            self._upsert_neon(points)
+        )
+        return qdrant_success and neon_success
+    
+    async def _upsert_qdrant(self, points: List[Dict[str, Any]]) -> bool:
+        """Write points to Qdrant if enabled. Returns False only on failure."""
+        if not (self.use_qdrant and self.qdrant_client):
+            return True
         
-        # Try Qdrant first if enabled
-        if self.use_qdrant and self.qdrant_client:
-            try:
-                import qdrant_client
-                from qdrant_client.http import models
-                
-                # Prepare payload with all metadata
-                payload = {
-                    "content": content,
-                    **metadata
-                }
-                
-                # Insert into Qdrant
-                self.qdrant_client.upsert(
-                    collection_name=self.collection_name,
-                    points=[
-                        models.PointStruct(
-                            id=id,
-                            vector=embedding,
-                            payload=payload
-                        )
-                    ]
+        try:
+            qdrant_points = [
+                models.PointStruct(
+                    id=point["id"],
+                    vector=point["embedding"],
+                    payload={"content": point["content"], **point["metadata"]}
                 )
-                
-                logger.debug(f"Inserted vector into Qdrant with ID: {id}")
-            except Exception as e:
-                logger.error(f"Failed to insert vector into Qdrant: {e}")
-                success = False
+                for point in points
+            ]
+            async with self._indexing_paused(len(points) >= self.bulk_upsert_threshold):
+                # Upserts are keyed by id, so retrying a failed write is safe
+                await self._with_retries(lambda: self.qdrant_client.upsert(
+                    collection_name=self.collection_name,
+                    points=qdrant_points
+                ))
+            
+            logger.debug(f"Inserted {len(points)} vectors into Qdrant")
+            return True
+        except Exception as e:
+            logger.error(f"Failed to insert vectors into Qdrant: {e}")
+            return False
+    
+    async def _with_retries(self, call: Callable[[], Awaitable[Any]]) -> Any:
+        """
+        Run a Qdrant call, retrying transient failures with jittered exponential backoff.
         
-        # Always insert into Neon for durability
-        if self.neon_client:
+        Used for writes, which have no fallback. Reads go straight to the Neon fallback
+        instead, so a Qdrant outage doesn't multiply their latency by the retry count.
+        Client errors (4xx responses) are raised immediately since retrying cannot fix them.
+        
+        Args:
+            call: Function returning a fresh awaitable for each attempt
+            
+        Returns:
+            Result of the first successful attempt
+        """
+        for attempt in range(self.qdrant_max_retries + 1):
             try:
-                # Extract tags from metadata
-                tags = metadata.get("tags", [])
-                memory_type = metadata.get("memory_type", "")
-                timestamp = metadata.get("timestamp")
-                payload_url = metadata.get("payload_url")
-                content_hash = metadata.get("content_hash", id)
-                
-                # Remove special fields from metadata
-                clean_metadata = {k: v for k, v in metadata.items() 
-                                 if k not in ["tags", "memory_type", "timestamp", "payload_url", "content_hash"]}
+                return await call()
+            except Exception as e:
+                if isinstance(e, UnexpectedResponse) and e.status_code is not None and e.status_code < 500:
+                    raise
+                if attempt == self.qdrant_max_retries:
+                    raise
+                delay = min(0.5, 0.05 * 2 ** attempt) + random.uniform(0, 0.05)
+                logger.debug(f"Qdrant call failed ({e}), retrying in {delay:.2f}s")
+                await asyncio.sleep(delay)
+    
+    @asynccontextmanager
+    async def _indexing_paused(self, pause: bool):
+        """
+        Disable Qdrant HNSW indexing for the duration of a bulk load, then restore it.
+        
+        The index is then built once by the optimizer instead of being updated per insert.
+        Concurrent bulk loads share a single pause: the original threshold is captured by
+        the first to enter and restored by the last to leave.
+        
+        Args:
+            pause: Whether to pause indexing; when False this is a no-op
+        """
+        if not pause:
+            yield
+            return
+        
+        async with self._indexing_pause_lock:
+            if self._indexing_pauses == 0:
+                collection_info = await self.qdrant_client.get_collection(self.collection_name)
+                indexing_threshold = collection_info.config.optimizer_config.indexing_threshold
+                if indexing_threshold is None:
+                    indexing_threshold = self.default_indexing_threshold
                 
-                # Insert into Neon
-                await self.neon_client.insert_event(
-                    content=content,
-                    content_hash=content_hash,
-                    embedding=embedding,
-                    tags=tags,
-                    memory_type=memory_type,
-                    metadata=clean_metadata,
-                    timestamp=timestamp,
-                    payload_url=payload_url
+                await self.qdrant_client.update_collection(
+                    collection_name=self.collection_name,
+                    optimizer_config=models.OptimizersConfigDiff(indexing_threshold=0)
                 )
-                
-                logger.debug(f"Inserted vector into Neon with ID: {id}")
-            except Exception as e:
-                logger.error(f"Failed to insert vector into Neon: {e}")
-                success = False
+                self._saved_indexing_threshold = indexing_threshold
+            self._indexing_pauses += 1
         
-        return success
+        try:
+            yield
+        finally:
+            async with self._indexing_pause_lock:
+                self._indexing_pauses -= 1
+                if self._indexing_pauses == 0:
+                    # The upload itself already succeeded or failed; don't mask that outcome
+                    try:
+                        await self.qdrant_client.update_collection(
+                            collection_name=self.collection_name,
+                            optimizer_config=models.OptimizersConfigDiff(
+                                indexing_threshold=self._saved_indexing_threshold
+                            )
+                        )
+                    except Exception as e:
+                        logger.error(f"Failed to restore Qdrant indexing threshold: {e}")
+    
+    async def _upsert_neon(self, points: List[Dict[str, Any]]) -> bool:
+        """Always write points to Neon for durability. Returns False only on failure."""
+        if not self.neon_client:
+            return True
+        
+        try:
+            await self.neon_client.insert_events([
+                self._neon_event(point["id"], point["content"], point["embedding"], point["metadata"])
+                for point in points
+            ])
+            
+            logger.debug(f"Inserted {len(points)} vectors into Neon")
+            return True
+        except Exception as e:
+            logger.error(f"Failed to insert vectors into Neon: {e}")
+            return False
+    
+    @staticmethod
+    def _neon_event(id: str, content: str, embedding: List[float], metadata: Dict[str, Any]) -> Dict[str, Any]:
+        """Map a vector store upsert onto NeonClient.insert_event keyword arguments."""
+        # Remove special fields from metadata
+        clean_metadata = {k: v for k, v in metadata.items() 
+                         if k not in ["tags", "memory_type", "timestamp", "payload_url", "content_hash"]}
+        
+        return {
+            "content": content,
+            "content_hash": metadata.get("content_hash", id),
+            "embedding": embedding,
+            "tags": metadata.get("tags", []),
+            "memory_type": metadata.get("memory_type", ""),
+            "metadata": clean_metadata,
+            "timestamp": metadata.get("timestamp"),
+            "payload_url": metadata.get("payload_url")
+        }
     
     async def search(self, 
                    embedding: List[float],
                    limit: int = 5,
                    similarity_threshold: float = 0.7,
-                   filter_dict: Optional[Dict[str, Any]] = None) -> List[Dict[str, Any]]:
+                   filter_dict: Optional[Dict[str, Any]] = None,
+                   hnsw_ef: Optional[int] = None) -> List[Dict[str, Any]]:
         """
         Search for similar vectors.
         
@@ -199,6 +361,7 @@ class VectorStoreClient:
             limit: Maximum number of results to return
             similarity_threshold: Minimum similarity threshold
             filter_dict: Optional filter criteria
+            hnsw_ef: Qdrant HNSW search breadth; defaults to QDRANT_HNSW_EF
             
         Returns:
             List of matching results with similarity scores
@@ -211,9 +374,6 @@ class VectorStoreClient:
         # Try Qdrant first if enabled
         if self.use_qdrant and self.qdrant_client:
             try:
-                import qdrant_client
-                from qdrant_client.http import models
-                
                 # Prepare filter if provided
                 filter_obj = None
                 if filter_dict:
@@ -249,29 +409,19 @@ class VectorStoreClient:
                             must=filter_conditions
                         )
                 
-                # Search in Qdrant
-                qdrant_results = self.qdrant_client.search(
+                # Search in Qdrant; a single attempt, since Neon is the fallback on failure
+                qdrant_results = await self.qdrant_client.search(
                     collection_name=self.collection_name,
                     query_vector=embedding,
                     limit=limit,
                     score_threshold=similarity_threshold,
                     with_payload=True,
-                    filter=filter_obj
+                    filter=filter_obj,
+                    search_params=self._search_params(hnsw_ef)
                 )
                 
                 # Process results
-                for point in qdrant_results:
-                    payload = point.payload
-                    
-                    # Extract content and metadata
-                    content = payload.pop("content", "")
-                    
-                    results.append({
-                        "id": point.id,
-                        "content": content,
-                        "similarity": point.score,
-                        "metadata": payload
-                    })
+                results = [self._point_to_result(point) for point in qdrant_results]
                 
                 logger.debug(f"Found {len(results)} results in Qdrant")
                 
@@ -306,6 +456,89 @@ class VectorStoreClient:
         
         return results
     
+    async def search_batch(self,
+                          embeddings: List[List[float]],
+                          limit: int = 5,
+                          similarity_threshold: float = 0.7,
+                          hnsw_ef: Optional[int] = None) -> List[List[Dict[str, Any]]]:
+        """
+        Search for several query vectors at once.
+        
+        Args:
+            embeddings: Query vectors
+            limit: Maximum number of results to return per query
+            similarity_threshold: Minimum similarity threshold
+            hnsw_ef: Qdrant HNSW search breadth; defaults to QDRANT_HNSW_EF
+            
+        Returns:
+            One list of matching results per query, in the same order as embeddings
+        """
+        if not self._is_initialized:
+            await self.initialize()
+        
+        results: List[List[Dict[str, Any]]] = [[] for _ in embeddings]
+        
+        # Send every query to Qdrant in a single request
+        if self.use_qdrant and self.qdrant_client and embeddings:
+            try:
+                search_params = self._search_params(hnsw_ef)
+                requests = [
+                    models.SearchRequest(
+                        vector=embedding,
+                        limit=limit,
+                        score_threshold=similarity_threshold,
+                        with_payload=True,
+                        params=search_params
+                    )
+                    for embedding in embeddings
+                ]
+                # A single attempt; queries Qdrant can't answer fall back to Neon below
+                batch_results = await self.qdrant_client.search_batch(
+                    collection_name=self.collection_name,
+                    requests=requests
+                )
+                results = [[self._point_to_result(point) for point in points] for points in batch_results]
+            except Exception as e:
+                logger.error(f"Failed to batch search in Qdrant: {e}")
+        
+        # Fall back to Neon for any query Qdrant did not answer, concurrently
+        missing = [i for i, query_results in enumerate(results) if not query_results]
+        if missing and self.neon_client:
+            neon_results = await asyncio.gather(
+                *(self.neon_client.search_by_vector(
+                    embedding=embeddings[i],
+                    limit=limit,
+                    similarity_threshold=similarity_threshold
+                ) for i in missing),
+                return_exceptions=True
+            )
+            for i, neon_result in zip(missing, neon_results):
+                if isinstance(neon_result, Exception):
+                    logger.error(f"Failed to search in Neon: {neon_result}")
+                else:
+                    results[i] = neon_result
+        
+        return results
+    
+    def _search_params(self, hnsw_ef: Optional[int] = None) -> "models.SearchParams":
+        """Build Qdrant search parameters for approximate HNSW search."""
+        return models.SearchParams(hnsw_ef=hnsw_ef or self.hnsw_ef, exact=False)
+    
+    @staticmethod
+    def _point_to_result(point) -> Dict[str, Any]:
+        """Convert a scored Qdrant point into a search result dict."""
+        payload = point.payload
+        
+        # Extract content and metadata
+        content = payload.pop("content", "")
+        
+        return {
+            "id": point.id,
+            "content": content,
+            "similarity": point.score,
+            "metadata": payload
+        }
+    
     async def delete(self, id: str) -> bool:
         """
         Delete a vector from the store.
@@ -324,12 +557,10 @@ class VectorStoreClient:
         # Try Qdrant first if enabled
         if self.use_qdrant and self.qdrant_client:
             try:
-                import qdrant_client
-                
                 # Delete from Qdrant
-                self.qdrant_client.delete(
+                await self.qdrant_client.delete(
                     collection_name=self.collection_name,
-                    points_selector=qdrant_client.http.models.PointIdsList(
+                    points_selector=models.PointIdsList(
                         points=[id]
                     )
                 )
@@ -382,18 +613,15 @@ class VectorStoreClient:
         # Delete from Qdrant if enabled
         if self.use_qdrant and self.qdrant_client and count > 0:
             try:
-                import qdrant_client
-                from qdrant_client.http import models
-                
                 # Delete from Qdrant by tag
-                self.qdrant_client.delete(
+                await self.qdrant_client.delete(
                     collection_name=self.collection_name,
-                    points_selector=qdrant_client.http.models.FilterSelector(
+                    points_selector=models.FilterSelector(
                         filter=models.Filter(
                             must=[
                                 models.FieldCondition(
                                     key="tags",
-                                    match=models.MatchText(text=tag)
+                                    match=models.MatchValue(value=tag)
                                 )
                             ]
                         )
@@ -436,10 +664,8 @@ class VectorStoreClient:
         # Get stats from Qdrant if enabled
         if self.use_qdrant and self.qdrant_client:
             try:
-                import qdrant_client
-                
                 # Get collection info
-                collection_info = self.qdrant_client.get_collection(self.collection_name)
+                collection_info = await self.qdrant_client.get_collection(self.collection_name)
                 
                 qdrant_stats = {
                     "vectors_count": collection_info.vectors_count,
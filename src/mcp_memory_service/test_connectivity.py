@@ -7,13 +7,18 @@ This script tests connections to all required services:
 - Neon PostgreSQL
 - Qdrant Vector Database
 - Cloudflare R2 Object Storage
+
+Install the package first (pip install -e .), then run:
+    python -m mcp_memory_service.test_connectivity
 """
 
 import os
 import sys
+import json
+import time
 import asyncio
 import logging
-from typing import Dict, Any, List, Optional
+from typing import Dict, Any, List, Optional, Tuple
 
 # Set up logging
 logging.basicConfig(
@@ -24,17 +29,20 @@ logger = logging.getLogger("connectivity_test")
 
 # Import EchoVault modules
 try:
-    from storage.neon_client import NeonClient
-    from storage.vector_store import VectorStoreClient
-    from storage.blob_store import BlobStoreClient
+    from mcp_memory_service.storage.neon_client import NeonClient
+    from mcp_memory_service.storage.vector_store import VectorStoreClient
+    from mcp_memory_service.storage.blob_store import BlobStoreClient
 except ImportError as e:
     logger.error(f"Failed to import EchoVault modules: {e}")
     sys.exit(1)
 
-async def test_neon_connection() -> bool:
+async def test_neon_connection(neon_client: Optional[NeonClient] = None) -> bool:
     """
     Test connection to Neon PostgreSQL.
     
+    Args:
+        neon_client: Shared client to test; one is created and closed if omitted
+        
     Returns:
         True if connection successful
     """
@@ -46,9 +54,11 @@ async def test_neon_connection() -> bool:
         logger.error("NEON_DSN environment variable is not set")
         return False
     
+    owns_client = neon_client is None
     try:
         # Initialize Neon client
-        neon_client = NeonClient()
+        if owns_client:
+            neon_client = NeonClient()
         await neon_client.initialize()
         
         # Get database stats
@@ -56,18 +66,49 @@ async def test_neon_connection() -> bool:
         logger.info(f"Connected to Neon PostgreSQL successfully")
         logger.info(f"Memory count: {stats.get('memory_count', 0)}")
         
-        # Close connection
-        await neon_client.close()
+        # Close connection unless the caller shares it
+        if owns_client:
+            await neon_client.close()
         
         return True
     except Exception as e:
         logger.error(f"Failed to connect to Neon PostgreSQL: {e}")
         return False
 
-async def test_qdrant_connection() -> bool:
+def create_qdrant_client():
+    """
+    Create a Qdrant client from the environment.
+    
+    Returns:
+        AsyncQdrantClient, or None if Qdrant is disabled, unconfigured or not installed
+    """
+    if os.environ.get("USE_QDRANT", "").lower() not in ("true", "1", "yes"):
+        return None
+    
+    qdrant_url = os.environ.get("QDRANT_URL")
+    if not qdrant_url:
+        return None
+    
+    try:
+        from qdrant_client import AsyncQdrantClient
+    except ImportError:
+        return None
+    
+    return AsyncQdrantClient(
+        url=qdrant_url,
+        api_key=os.environ.get("QDRANT_API_KEY"),
+        prefer_grpc=os.environ.get("QDRANT_PREFER_GRPC", "").lower() in ("true", "1", "yes"),
+        grpc_port=int(os.environ.get("QDRANT_GRPC_PORT", "6334")),
+        timeout=int(os.environ.get("QDRANT_TIMEOUT", "5"))
+    )
+
+async def test_qdrant_connection(qdrant_client=None) -> bool:
     """
     Test connection to Qdrant.
     
+    Args:
+        qdrant_client: Shared client to test; one is created and closed if omitted
+    
     Returns:
         True if connection successful
     """
@@ -79,29 +120,21 @@ async def test_qdrant_connection() -> bool:
         logger.info("Qdrant is disabled, skipping test")
         return True
     
-    # Check if Qdrant URL is configured
-    qdrant_url = os.environ.get("QDRANT_URL")
-    if not qdrant_url:
-        logger.error("QDRANT_URL environment variable is not set")
-        return False
-    
-    try:
-        # Import Qdrant client
-        try:
-            import qdrant_client
-            from qdrant_client import QdrantClient
-        except ImportError:
-            logger.error("qdrant-client package is not installed")
+    owns_client = qdrant_client is None
+    if owns_client:
+        # Check if Qdrant URL is configured
+        if not os.environ.get("QDRANT_URL"):
+            logger.error("QDRANT_URL environment variable is not set")
             return False
         
-        # Initialize Qdrant client
-        qdrant_client = QdrantClient(
-            url=qdrant_url,
-            api_key=os.environ.get("QDRANT_API_KEY")
-        )
-        
+        qdrant_client = create_qdrant_client()
+        if qdrant_client is None:
+            logger.error("qdrant-client package is not installed")
+            return False
+    
+    try:
         # Test connection by getting collections
-        collections = qdrant_client.get_collections()
+        collections = await qdrant_client.get_collections()
         logger.info(f"Connected to Qdrant successfully")
         logger.info(f"Collections: {[c.name for c in collections.collections]}")
         
@@ -109,6 +142,9 @@ async def test_qdrant_connection() -> bool:
     except Exception as e:
         logger.error(f"Failed to connect to Qdrant: {e}")
         return False
+    finally:
+        if owns_client:
+            await qdrant_client.close()
 
 async def test_r2_connection() -> bool:
     """
@@ -160,18 +196,32 @@ async def test_r2_connection() -> bool:
         logger.error(f"Failed to connect to Cloudflare R2: {e}")
         return False
 
+async def timed_probe(probe) -> Tuple[bool, float]:
+    """
+    Run a connection probe and measure its latency.
+    
+    Returns:
+        Tuple of (success, latency in milliseconds)
+    """
+    start = time.perf_counter()
+    success = await probe()
+    return success, (time.perf_counter() - start) * 1000
+
 async def test_all_connections():
     """Test connections to all services."""
     logger.info("Starting EchoVault connectivity tests")
     
-    # Test Neon connection
-    neon_success = await test_neon_connection()
+    # One Neon pool and one Qdrant connection serve both the probes and the
+    # unified vector store test, so each handshake is paid once
+    neon_client = NeonClient()
+    qdrant_client = create_qdrant_client()
     
-    # Test Qdrant connection
-    qdrant_success = await test_qdrant_connection()
-    
-    # Test R2 connection
-    r2_success = await test_r2_connection()
+    # The probes are independent, so run them concurrently (wall time ~ slowest probe)
+    (neon_success, neon_ms), (qdrant_success, qdrant_ms), (r2_success, r2_ms) = await asyncio.gather(
+        timed_probe(lambda: test_neon_connection(neon_client)),
+        timed_probe(lambda: test_qdrant_connection(qdrant_client)),
+        timed_probe(test_r2_connection)
+    )
     
     # Print summary
     print("\n=== EchoVault Connectivity Test Results ===")
@@ -184,7 +234,7 @@ async def test_all_connections():
     if neon_success or qdrant_success:
         try:
             logger.info("Testing unified vector store client...")
-            vector_store = VectorStoreClient()
+            vector_store = VectorStoreClient(neon_client=neon_client, qdrant_client=qdrant_client)
             await vector_store.initialize()
             
             stats = await vector_store.get_stats()
@@ -198,12 +248,31 @@ async def test_all_connections():
             logger.error(f"Failed to test vector store client: {e}")
             print(f"Vector Store Client: ❌ Initialization failed")
     
+    await neon_client.close()
+    if qdrant_client is not None:
+        await qdrant_client.close()
+    
     # Overall status
     if neon_success and qdrant_success and r2_success:
         print("\n✅ All connections successful!")
     else:
         print("\n⚠️ Some connections failed. See logs for details.")
+    
+    # Machine-readable results so CI can track connection latency across runs
+    if os.getenv("VERIFY_JSON"):
+        json.dump({
+            "neon": {"ok": neon_success, "latency_ms": round(neon_ms, 2)},
+            "qdrant": {"ok": qdrant_success, "latency_ms": round(qdrant_ms, 2)},
+            "r2": {"ok": r2_success, "latency_ms": round(r2_ms, 2)}
+        }, sys.stdout)
+        print()
 
 if __name__ == "__main__":
     print("\nEchoVault Connectivity Test\n" + "=" * 30)
+    # Prefer uvloop's faster event loop when available (POSIX only)
+    try:
+        import uvloop
+        asyncio.set_event_loop_policy(uvloop.EventLoopPolicy())
+    except ImportError:
+        pass
     asyncio.run(test_all_connections())
\ No newline at end of file
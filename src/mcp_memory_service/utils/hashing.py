@@ -29,4 +29,5 @@ def generate_content_hash(content: str, metadata: Optional[Dict[str, Any]] = Non
             hash_content += json.dumps(static_metadata, sort_keys=True, ensure_ascii=True)
     
     # Generate hash
-    return hashlib.sha256(hash_content.encode('utf-8')).hexdigest()
\ No newline at end of file
+    # Dedup key, not a security boundary: skip FIPS-mode checks. Keep sha256 so existing hashes stay valid
+    return hashlib.sha256(hash_content.encode('utf-8'), usedforsecurity=False).hexdigest()
\ No newline at end of file
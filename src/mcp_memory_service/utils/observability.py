@@ -191,9 +191,9 @@ def trace_function(name: Optional[str] = None):
                 span.set_attribute("function.name", func.__name__)
                 
                 try:
-                    start_time = time.time()
+                    start_time = time.perf_counter()
                     result = await func(*args, **kwargs)
-                    duration = time.time() - start_time
+                    duration = time.perf_counter() - start_time
                     
                     # Record duration in span
                     span.set_attribute("duration_seconds", duration)
@@ -239,9 +239,9 @@ def trace_function(name: Optional[str] = None):
                 span.set_attribute("function.name", func.__name__)
                 
                 try:
-                    start_time = time.time()
+                    start_time = time.perf_counter()
                     result = func(*args, **kwargs)
-                    duration = time.time() - start_time
+                    duration = time.perf_counter() - start_time
                     
                     # Record duration in span
                     span.set_attribute("duration_seconds", duration)
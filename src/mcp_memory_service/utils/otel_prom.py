@@ -261,14 +261,14 @@ def trace_async(name: str = None):
                 span.set_attribute("function.name", func.__name__)
                 
                 # Record start time for Prometheus metrics
-                start_time = time.time()
+                start_time = time.perf_counter()
                 
                 try:
                     # Execute the function
                     result = await func(*args, **kwargs)
                     
                     # Calculate duration for Prometheus
-                    duration = time.time() - start_time
+                    duration = time.perf_counter() - start_time
                     
                     # Record metrics based on function name
                     if PROMETHEUS_AVAILABLE and _metrics:
@@ -313,14 +313,14 @@ def trace_sync(name: str = None):
                 span.set_attribute("function.name", func.__name__)
                 
                 # Record start time for Prometheus metrics
-                start_time = time.time()
+                start_time = time.perf_counter()
                 
                 try:
                     # Execute the function
                     result = func(*args, **kwargs)
                     
                     # Calculate duration for Prometheus
-                    duration = time.time() - start_time
+                    duration = time.perf_counter() - start_time
                     
                     # Record metrics based on function name
                     if PROMETHEUS_AVAILABLE and _metrics:
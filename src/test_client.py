@@ -54,9 +54,9 @@ class MCPTestClient:
             sys.stdout.flush()
             
             # Read response from stdin with timeout
-            start_time = time.time()
+            start_time = time.monotonic()
             while True:
-                if time.time() - start_time > timeout:
+                if time.monotonic() - start_time > timeout:
                     raise TimeoutError(f"No response received within {timeout} seconds")
                 
                 try:
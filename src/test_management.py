@@ -25,6 +25,9 @@ logging.basicConfig(
 )
 logger = logging.getLogger(__name__)
 
+# Maximum number of store operations in flight at once
+STORE_CONCURRENCY = 16
+
 def print_separator(title):
     print("\n" + "="*50)
     print(f" {title} ")
@@ -33,6 +36,32 @@ def print_separator(title):
     logger.info(f" {title} ")
     logger.info("="*50 + "\n")
 
+def _jaccard(a, b):
+    """Word-level Jaccard similarity between two strings."""
+    words_a, words_b = set(a.lower().split()), set(b.lower().split())
+    if not words_a or not words_b:
+        return 0.0
+    return len(words_a & words_b) / len(words_a | words_b)
+
+def mmr_diversity(results, lambda_=0.5):
+    """
+    Mean Maximal Marginal Relevance over ranked results.
+
+    Each result scores lambda * relevance - (1 - lambda) * its highest
+    similarity to a better-ranked result. Content Jaccard stands in for
+    embedding similarity, so near-duplicate hits drag the score down.
+    """
+    if not results:
+        return 0.0
+    scores = []
+    for i, result in enumerate(results):
+        redundancy = max(
+            (_jaccard(result.memory.content, prev.memory.content) for prev in results[:i]),
+            default=0.0
+        )
+        scores.append(lambda_ * result.relevance_score - (1 - lambda_) * redundancy)
+    return sum(scores) / len(scores)
+
 async def test_management_features():
     try:
         # Initialize the server
@@ -67,33 +96,44 @@ async def test_management_features():
             }
         ]
 
-        stored_memories = []
+        # Build the expected Memory objects (and their hashes) once up front
+        expected_memories = [
+            Memory(
+                content=memory_data["content"],
+                content_hash=generate_content_hash(memory_data["content"], memory_data["metadata"]),
+                tags=[tag.strip() for tag in memory_data["metadata"].get("tags", "").split(",") if tag.strip()],
+                memory_type=memory_data["metadata"].get("type"),
+                metadata=memory_data["metadata"]
+            )
+            for memory_data in test_memories
+        ]
+
+        # Stores are independent round-trips, so dispatch them concurrently;
+        # the semaphore keeps us within the backend's connection limits.
+        store_limit = asyncio.Semaphore(STORE_CONCURRENCY)
+
+        async def store_one(memory_data):
+            async with store_limit:
+                return await memory_server.handle_store_memory(memory_data)
+
         for memory_data in test_memories:
             print(f"Storing memory: {json.dumps(memory_data, indent=2)}")
-            
-            # Create Memory object directly
-            # tags = [tag.strip() for tag in memory_data["metadata"].get("tags", "").split(",") if tag.strip()]
-            # memory = Memory(
-            #     content=memory_data["content"],
-            #     content_hash=generate_content_hash(memory_data["content"], memory_data["metadata"]),
-            #     tags=tags,
-            #     memory_type=memory_data["metadata"].get("type"),
-            #     metadata=memory_data["metadata"]
-            # )
-            
-            response = await memory_server.handle_store_memory(memory_data)
-            
+        # A failed store cancels the rest so the suite fails fast
+        if sys.version_info >= (3, 11):
+            async with asyncio.TaskGroup() as tg:
+                tasks = [tg.create_task(store_one(memory_data)) for memory_data in test_memories]
+            responses = [task.result() for task in tasks]
+        else:
+            responses = await asyncio.gather(
+                *(store_one(memory_data) for memory_data in test_memories)
+            )
+
+        for response in responses:
             print(f"Store response: [{response[0].text}]")
-            if "Successfully stored memory" in response[0].text:
-                tags = [tag.strip() for tag in memory_data["metadata"].get("tags", "").split(",") if tag.strip()]
-                memory = Memory(
-                    content=memory_data["content"],
-                    content_hash=generate_content_hash(memory_data["content"], memory_data["metadata"]),
-                    tags=tags,
-                    memory_type=memory_data["metadata"].get("type"),
-                    metadata=memory_data["metadata"]
-                )
-                stored_memories.append(memory)
+        stored_memories = [
+            memory for memory, response in zip(expected_memories, responses)
+            if "Successfully stored memory" in response[0].text
+        ]
 
         # 2. Test retrieve_memory
         print_separator("Testing retrieve_memory")
@@ -109,6 +149,7 @@ async def test_management_features():
             print(f"  Content: {result.memory.content}")
             print(f"  Tags: {result.memory.tags}")
             print(f"  Score: {result.relevance_score}")
+        print(f"Diversity (MMR, lambda=0.5): {mmr_diversity(results):.3f}")
 
         # 3. Test search_by_tag
         print_separator("Testing search_by_tag")
@@ -188,11 +229,12 @@ async def test_management_features():
 
         # Final verification
         print_separator("Final Verification")
-        # Verify database is empty or in expected state
-        tag_results = await memory_server.storage.search_by_tag(["meeting"])
+        # Verify database is empty or in expected state; the two lookups are independent
+        tag_results, results = await asyncio.gather(
+            memory_server.storage.search_by_tag(["meeting"]),
+            memory_server.storage.retrieve("important meeting", 5)
+        )
         print(f"Remaining memories with 'meeting' tag: {len(tag_results)}")
-        
-        results = await memory_server.storage.retrieve("important meeting", 5)
         print(f"Remaining memories matching 'important meeting': {len(results)}")
 
     except Exception as e:
@@ -202,6 +244,12 @@ async def test_management_features():
         print("\nTest suite completed")
 
 if __name__ == "__main__":
+    # Prefer uvloop's faster event loop when available (POSIX only)
+    try:
+        import uvloop
+        asyncio.set_event_loop_policy(uvloop.EventLoopPolicy())
+    except ImportError:
+        pass
     # Ensure stdout is flushed immediately
     sys.stdout.reconfigure(line_buffering=True)
     asyncio.run(test_management_features())
\ No newline at end of file
@@ -0,0 +1,75 @@
+"""
+Test duplicate cleanup in EchoVault storage
+Copyright (c) 2025 EchoVault
+Licensed under the MIT License.
+"""
+
+import asyncio
+from contextlib import asynccontextmanager
+
+import pytest
+
+from src.mcp_memory_service.storage.echovault import EchoVaultStorage
+
+
+class StubConnection:
+    """asyncpg connection double that pages through fixed duplicate groups."""
+
+    def __init__(self, groups):
+        self.groups = groups
+        self.fetches = []
+
+    async def fetch(self, query, last_content, limit):
+        self.fetches.append((last_content, limit))
+        remaining = [group for group in self.groups if last_content is None or group["content"] > last_content]
+        return remaining[:limit]
+
+
+class SingleConnectionPool:
+    """asyncpg pool double with one connection, like NEON_POOL_SIZE=1."""
+
+    def __init__(self, conn):
+        self.conn = conn
+        self._slot = asyncio.Semaphore(1)
+
+    @asynccontextmanager
+    async def acquire(self):
+        async with self._slot:
+            yield self.conn
+
+
+class StubVectorStore:
+    """VectorStoreClient double whose deletes need a pool connection, like the Neon delete."""
+
+    def __init__(self, pool):
+        self.pool = pool
+        self.deleted = []
+
+    async def delete(self, id):
+        async with self.pool.acquire():
+            self.deleted.append(id)
+        return True
+
+
+@pytest.mark.asyncio
+async def test_cleanup_duplicates_with_single_connection_pool():
+    """Deletes run after the page's connection is released, so a one-connection pool does not deadlock."""
+    groups = [
+        {"content": f"memory {i}", "content_hashes": [f"keep_{i}", f"dup_{i}"], "payload_urls": [None, None]}
+        for i in range(3)
+    ]
+    conn = StubConnection(groups)
+    pool = SingleConnectionPool(conn)
+
+    storage = EchoVaultStorage()
+    storage._is_initialized = True
+    storage.neon_client.pool = pool
+    storage.neon_client.cursor_prefetch = 2
+    storage.vector_store = StubVectorStore(pool)
+
+    count, message = await asyncio.wait_for(storage.cleanup_duplicates(), timeout=1)
+
+    assert count == 3
+    assert message == "Successfully removed 3 duplicate memories"
+    assert storage.vector_store.deleted == ["dup_0", "dup_1", "dup_2"]
+    assert conn.fetches == [(None, 2), ("memory 1", 2)]
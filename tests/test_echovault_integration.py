@@ -7,6 +7,7 @@ Licensed under the MIT License.
 import os
 import json
 import pytest
+import pytest_asyncio
 import asyncio
 import uuid
 import time
@@ -20,19 +21,24 @@ from src.mcp_memory_service.utils.hashing import generate_content_hash
 # Enable EchoVault for tests
 os.environ["USE_ECHOVAULT"] = "true"
 
-@pytest.fixture
+# Run every test on the module-scoped loop that owns the shared storage's connections
+pytestmark = pytest.mark.asyncio(loop_scope="module")
+
+@pytest_asyncio.fixture(scope="module", loop_scope="module")
 async def storage():
-    """Create and initialize an EchoVaultStorage instance for testing."""
+    """
+    Create and initialize one EchoVaultStorage instance for the whole module.
+    
+    Connection pools are opened once and shared by every test in the module.
+    """
     client = EchoVaultStorage()
     await client.initialize()
     
     yield client
     
     # Cleanup
-    if hasattr(client, "neon_client"):
-        await client.neon_client.close()
+    await client.close()
 
-@pytest.mark.asyncio
 async def test_initialize():
     """Test initialization of EchoVault storage."""
     storage = EchoVaultStorage()
@@ -46,7 +52,6 @@ async def test_initialize():
     # Clean up
     await storage.neon_client.close()
 
-@pytest.mark.asyncio
 async def test_store_memory(storage):
     """Test storing a memory."""
     # Create a test memory
@@ -79,7 +84,6 @@ async def test_store_memory(storage):
         # Clean up
         await conn.execute("DELETE FROM memories WHERE content_hash = $1", content_hash)
 
-@pytest.mark.asyncio
 async def test_store_large_memory(storage):
     """Test storing a large memory that should be moved to blob storage."""
     # Set a lower threshold temporarily for testing
@@ -87,8 +91,8 @@ async def test_store_large_memory(storage):
     storage.blob_store.blob_threshold = 200  # 200 bytes
     
     try:
-        # Skip test if R2 is not configured
-        if not storage.blob_store.is_configured():
+        # Skip test if R2 is not configured (blob storage connects lazily on first use)
+        if not await storage._blob_store_ready():
             pytest.skip("R2 not configured, skipping large memory test")
         
         # Create a large memory
@@ -135,13 +139,12 @@ async def test_store_large_memory(storage):
             await conn.execute("DELETE FROM memories WHERE content_hash = $1", content_hash)
         
         # Delete blob
-        if storage.blob_store.is_configured() and payload_url:
+        if payload_url:
             await storage.blob_store.delete_blob(payload_url)
     finally:
         # Restore original threshold
         storage.blob_store.blob_threshold = original_threshold
 
-@pytest.mark.asyncio
 async def test_retrieve_memory(storage):
     """Test retrieving memories."""
     # Create multiple memories with varying similarity to a query
@@ -187,7 +190,6 @@ async def test_retrieve_memory(storage):
     for content_hash in memory_hashes:
         await storage.delete(content_hash)
 
-@pytest.mark.asyncio
 async def test_search_by_tag(storage):
     """Test searching memories by tags."""
     # Create unique tag for this test
@@ -224,7 +226,6 @@ async def test_search_by_tag(storage):
     for content_hash in test_memories:
         await storage.delete(content_hash)
 
-@pytest.mark.asyncio
 async def test_delete_memory(storage):
     """Test deleting a memory."""
     # Create a test memory
@@ -259,7 +260,6 @@ async def test_delete_memory(storage):
         row = await conn.fetchrow("SELECT * FROM memories WHERE content_hash = $1", content_hash)
         assert row is None
 
-@pytest.mark.asyncio
 async def test_delete_by_tag(storage):
     """Test deleting memories by tag."""
     # Create unique tag for this test
@@ -294,7 +294,6 @@ async def test_delete_by_tag(storage):
         rows = await conn.fetch("SELECT * FROM memories WHERE content_hash = ANY($1::text[])", test_memories)
         assert len(rows) == 0
 
-@pytest.mark.asyncio
 async def test_cleanup_duplicates(storage):
     """Test cleaning up duplicate memories."""
     # Create unique content for this test
@@ -344,7 +343,6 @@ async def test_cleanup_duplicates(storage):
         # Clean up remaining memory
         await conn.execute("DELETE FROM memories WHERE content = $1", unique_content)
 
-@pytest.mark.asyncio
 async def test_otel_instrumentation():
     """Test OpenTelemetry instrumentation."""
     from src.mcp_memory_service.utils import otel_prom
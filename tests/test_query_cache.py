@@ -0,0 +1,45 @@
+"""Test the query_cache module."""
+from src.mcp_memory_service.utils.query_cache import QueryCache
+
+def test_get_returns_stored_value():
+    """Test that a stored value is returned for the same key."""
+    cache = QueryCache(maxsize=4, ttl=60)
+    cache.put(("hello", 5), ["result"])
+    assert cache.get(("hello", 5)) == ["result"]
+    assert cache.get(("hello", 10)) is None
+
+def test_least_recently_used_entry_is_evicted():
+    """Test LRU eviction once maxsize is reached."""
+    cache = QueryCache(maxsize=2, ttl=60)
+    cache.put("a", 1)
+    cache.put("b", 2)
+    cache.get("a")  # "b" is now least recently used
+    cache.put("c", 3)
+
+    assert cache.get("b") is None
+    assert cache.get("a") == 1
+    assert cache.get("c") == 3
+    assert len(cache) == 2
+
+def test_expired_entries_are_ignored():
+    """Test that entries past their ttl are not returned."""
+    cache = QueryCache(maxsize=2, ttl=0)
+    cache.put("a", 1)
+    assert cache.get("a") is None
+    assert len(cache) == 0
+
+def test_zero_maxsize_disables_cache():
+    """Test that maxsize=0 stores nothing."""
+    cache = QueryCache(maxsize=0, ttl=60)
+    cache.put("a", 1)
+    assert cache.get("a") is None
+
+def test_clear_and_normalize_query():
+    """Test clearing the cache and query normalization."""
+    cache = QueryCache()
+    cache.put(QueryCache.normalize_query("  Important   Meeting "), 1)
+    assert cache.get("Important Meeting") == 1
+    assert cache.get("important meeting") is None
+
+    cache.clear()
+    assert cache.get("Important Meeting") is None
@@ -0,0 +1,62 @@
+"""
+Test batched retrieval in EchoVault storage
+Copyright (c) 2025 EchoVault
+Licensed under the MIT License.
+"""
+
+import pytest
+
+from src.mcp_memory_service.storage.echovault import EchoVaultStorage
+
+
+class StubVectorStore:
+    """VectorStoreClient double answering each query embedding with one hit."""
+
+    def __init__(self):
+        self.search_batch_calls = []
+
+    async def search_batch(self, embeddings, limit, similarity_threshold):
+        self.search_batch_calls.append(embeddings)
+        return [
+            [{
+                "id": f"hash_{embedding[0]:.0f}",
+                "content": f"memory {embedding[0]:.0f}",
+                "similarity": 0.9,
+                "metadata": {"content_hash": f"hash_{embedding[0]:.0f}", "tags": ["test"], "memory_type": "note"}
+            }]
+            for embedding in embeddings
+        ]
+
+
+@pytest.fixture
+def storage():
+    """EchoVaultStorage with a stub embedder and vector store."""
+    storage = EchoVaultStorage()
+    storage._is_initialized = True
+    storage.vector_store = StubVectorStore()
+
+    async def generate_embedding(query):
+        return [float(query.split()[-1]), 0.0, 0.0]
+
+    storage._generate_embedding = generate_embedding
+    return storage
+
+
+@pytest.mark.asyncio
+async def test_retrieve_batch_sends_one_search(storage):
+    """All queries go to the vector store in one search_batch call, results in query order."""
+    results = await storage.retrieve_batch(["query 1", "query 2", "query 3"], n_results=1)
+
+    assert storage.vector_store.search_batch_calls == [[[1.0, 0.0, 0.0], [2.0, 0.0, 0.0], [3.0, 0.0, 0.0]]]
+    assert [[result.memory.content_hash for result in query_results] for query_results in results] == [
+        ["hash_1"], ["hash_2"], ["hash_3"]
+    ]
+    assert results[0][0].memory.tags == ["test"]
+    assert results[0][0].relevance_score == 0.9
+
+
+@pytest.mark.asyncio
+async def test_retrieve_batch_empty(storage):
+    """No queries means no search."""
+    assert await storage.retrieve_batch([]) == []
+    assert storage.vector_store.search_batch_calls == []
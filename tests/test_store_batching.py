@@ -0,0 +1,109 @@
+"""
+Test the EchoVault store micro-batcher
+Copyright (c) 2025 EchoVault
+Licensed under the MIT License.
+"""
+
+import asyncio
+
+import pytest
+
+from src.mcp_memory_service.storage.echovault import EchoVaultStorage
+from src.mcp_memory_service.models.memory import Memory
+
+
+def make_memory(i: int) -> Memory:
+    """Build a small memory with a unique hash."""
+    return Memory(content=f"memory {i}", content_hash=f"hash_{i}")
+
+
+@pytest.fixture
+def storage():
+    """EchoVaultStorage with batching enabled and no live backends."""
+    storage = EchoVaultStorage()
+    storage._is_initialized = True
+    storage._store_batching = True
+    storage._store_batch_size = 3
+    storage._store_batch_wait = 0.05
+    return storage
+
+
+@pytest.mark.asyncio
+async def test_concurrent_stores_are_batched(storage):
+    """Concurrent store() calls are coalesced into store_batch() calls of bounded size."""
+    batches = []
+
+    async def store_batch(memories):
+        batches.append([memory.content_hash for memory in memories])
+        return [(True, f"Successfully stored memory {memory.content_hash}") for memory in memories]
+
+    storage.store_batch = store_batch
+
+    results = await asyncio.gather(*(storage.store(make_memory(i)) for i in range(5)))
+
+    assert [len(batch) for batch in batches] == [3, 2]
+    assert results == [(True, f"Successfully stored memory hash_{i}") for i in range(5)]
+    await storage.close()
+
+
+@pytest.mark.asyncio
+async def test_batch_error_is_reported_to_every_caller(storage):
+    """A store_batch() exception fails each queued store instead of hanging it."""
+    async def store_batch(memories):
+        raise RuntimeError("backend unavailable")
+
+    storage.store_batch = store_batch
+
+    results = await asyncio.gather(*(storage.store(make_memory(i)) for i in range(2)))
+
+    assert all(success is False for success, _ in results)
+    assert all("backend unavailable" in message for _, message in results)
+
+    # The writer survives the failure and keeps serving later stores
+    async def recovered_store_batch(memories):
+        return [(True, "ok") for _ in memories]
+
+    storage.store_batch = recovered_store_batch
+    assert await storage.store(make_memory(3)) == (True, "ok")
+    await storage.close()
+
+
+@pytest.mark.asyncio
+async def test_close_flushes_queued_stores(storage):
+    """close() waits for queued stores to be written before stopping the writer."""
+    written = []
+
+    async def store_batch(memories):
+        await asyncio.sleep(0.01)
+        written.extend(memory.content_hash for memory in memories)
+        return [(True, "ok") for _ in memories]
+
+    storage.store_batch = store_batch
+
+    pending = [asyncio.create_task(storage.store(make_memory(i))) for i in range(4)]
+    await asyncio.sleep(0)
+    await storage.close()
+
+    assert written == [f"hash_{i}" for i in range(4)]
+    assert [await task for task in pending] == [(True, "ok")] * 4
+    assert storage._store_flusher is None
+
+
+@pytest.mark.asyncio
+async def test_cancelled_writer_fails_in_flight_stores(storage):
+    """Stores caught in a batch when the writer is cancelled get an error, not a hang."""
+    started = asyncio.Event()
+
+    async def store_batch(memories):
+        started.set()
+        await asyncio.sleep(10)
+
+    storage.store_batch = store_batch
+
+    pending = [asyncio.create_task(storage.store(make_memory(i))) for i in range(2)]
+    await started.wait()
+    storage._store_flusher.cancel()
+
+    for task in pending:
+        with pytest.raises(RuntimeError, match="stopped before the memory was written"):
+            await asyncio.wait_for(task, timeout=1)
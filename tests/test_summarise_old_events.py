@@ -0,0 +1,84 @@
+"""
+Test the old-event summarizer's retention cleanup
+Copyright (c) 2025 EchoVault
+Licensed under the MIT License.
+"""
+
+import os
+import importlib.util
+from contextlib import asynccontextmanager
+
+import pytest
+from qdrant_client.http import models
+
+SCRIPT_PATH = os.path.join(os.path.dirname(__file__), "..", "scripts", "summarise_old_events.py")
+
+
+class StubConnection:
+    """asyncpg connection double that returns fixed rows."""
+
+    def __init__(self, rows):
+        self.rows = rows
+        self.executed = []
+
+    async def fetch(self, query, *args):
+        return self.rows
+
+    async def execute(self, query, *args):
+        self.executed.append(args)
+
+
+class StubPool:
+    """asyncpg pool double handing out a single connection."""
+
+    def __init__(self, conn):
+        self.conn = conn
+
+    @asynccontextmanager
+    async def acquire(self):
+        yield self.conn
+
+
+class StubQdrantClient:
+    """AsyncQdrantClient double that records deleted point ids."""
+
+    def __init__(self):
+        self.deleted = []
+
+    async def delete(self, collection_name, points_selector):
+        self.deleted.append((collection_name, points_selector))
+
+
+@pytest.fixture
+def summarizer(tmp_path, monkeypatch):
+    """Load the script as a module and build a summarizer wired to stub backends."""
+    # The script logs to a file in the working directory
+    monkeypatch.chdir(tmp_path)
+    spec = importlib.util.spec_from_file_location("summarise_old_events", SCRIPT_PATH)
+    module = importlib.util.module_from_spec(spec)
+    spec.loader.exec_module(module)
+
+    summarizer = module.MemorySummarizer()
+    summarizer._is_initialized = True
+    summarizer.vector_store.use_qdrant = True
+    summarizer.vector_store.qdrant_client = StubQdrantClient()
+    return summarizer
+
+
+@pytest.mark.asyncio
+async def test_delete_old_memories_removes_qdrant_points(summarizer):
+    """Old memories are deleted from Qdrant, not just from Neon."""
+    rows = [{"content_hash": f"hash_{i}", "payload_url": None} for i in range(150)]
+    summarizer.neon_client.pool = StubPool(StubConnection(rows))
+
+    deleted = await summarizer.delete_old_memories(days=365)
+
+    assert deleted == 150
+    qdrant = summarizer.vector_store.qdrant_client
+    assert len(qdrant.deleted) == 2
+    deleted_ids = []
+    for collection_name, selector in qdrant.deleted:
+        assert collection_name == summarizer.vector_store.collection_name
+        assert isinstance(selector, models.PointIdsList)
+        deleted_ids.extend(selector.points)
+    assert deleted_ids == [row["content_hash"] for row in rows]
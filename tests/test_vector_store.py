@@ -8,6 +8,7 @@ import os
 import json
 import pytest
 import asyncio
+from types import SimpleNamespace
 from typing import Dict, Any, List
 
 # Import the VectorStoreClient
@@ -77,6 +78,43 @@ async def test_upsert(vector_store):
         # Clean up
         await conn.execute("DELETE FROM memories WHERE content_hash = $1", test_id)
 
+@pytest.mark.asyncio
+async def test_upsert_batch(vector_store):
+    """Test upserting several vectors in one batch."""
+    # Create test data
+    points = []
+    for i in range(3):
+        test_id = f"test_upsert_batch_{i}_{asyncio.get_event_loop().time()}"
+        points.append({
+            "id": test_id,
+            "content": f"Test batch content {i}",
+            "embedding": [0.1 * (i + 1), 0.2, 0.3] * 512,  # 1536 dimensions
+            "metadata": {
+                "content_hash": test_id,
+                "memory_type": "test",
+                "tags": ["test", "vector", "batch"],
+                "timestamp": int(asyncio.get_event_loop().time())
+            }
+        })
+    
+    # Upsert all vectors at once
+    success = await vector_store.upsert_batch(points)
+    
+    # Verify success
+    assert success is True
+    
+    # Verify every point was stored
+    test_ids = [point["id"] for point in points]
+    async with vector_store.neon_client.pool.acquire() as conn:
+        rows = await conn.fetch("SELECT content_hash, content FROM memories WHERE content_hash = ANY($1)", test_ids)
+        
+        assert {row["content_hash"]: row["content"] for row in rows} == {
+            point["id"]: point["content"] for point in points
+        }
+        
+        # Clean up
+        await conn.execute("DELETE FROM memories WHERE content_hash = ANY($1)", test_ids)
+
 @pytest.mark.asyncio
 async def test_search(vector_store):
     """Test vector search functionality."""
@@ -136,6 +174,43 @@ async def test_search(vector_store):
     for test_id in test_vectors:
         await vector_store.delete(test_id)
 
+@pytest.mark.asyncio
+async def test_search_batch(vector_store):
+    """Test searching for several query vectors at once."""
+    # Create and insert test vectors pointing in clearly different directions
+    embeddings = [[0.9, 0.1, 0.1] * 512, [0.1, 0.9, 0.1] * 512]
+    test_ids = []
+    for i, embedding in enumerate(embeddings):
+        test_id = f"test_search_batch_{i}_{asyncio.get_event_loop().time()}"
+        await vector_store.upsert(
+            id=test_id,
+            content=f"Test batch search content {i}",
+            embedding=embedding,
+            metadata={
+                "content_hash": test_id,
+                "memory_type": "test",
+                "tags": ["test", "vector", "search_batch"],
+                "timestamp": int(asyncio.get_event_loop().time())
+            }
+        )
+        test_ids.append(test_id)
+    
+    # Search for both vectors in one call
+    results = await vector_store.search_batch(
+        embeddings=embeddings,
+        limit=1,
+        similarity_threshold=0.0
+    )
+    
+    # One result list per query, each led by its own vector
+    assert len(results) == 2
+    assert results[0][0]["id"] == test_ids[0]
+    assert results[1][0]["id"] == test_ids[1]
+    
+    # Clean up
+    for test_id in test_ids:
+        await vector_store.delete(test_id)
+
 @pytest.mark.asyncio
 async def test_delete(vector_store):
     """Test deleting vectors from the store."""
@@ -309,4 +384,103 @@ async def test_qdrant_integration():
     finally:
         # Cleanup and reset environment
         await client.close()
-        os.environ["USE_QDRANT"] = "false"
\ No newline at end of file
+        os.environ["USE_QDRANT"] = "false"
+
+
+class StubIndexingQdrantClient:
+    """AsyncQdrantClient double that tracks the collection's indexing threshold."""
+    
+    def __init__(self, indexing_threshold, fail_restore=False):
+        self.indexing_threshold = indexing_threshold
+        self.fail_restore = fail_restore
+        self.threshold_updates = []
+        self.upserts = 0
+    
+    async def get_collection(self, collection_name):
+        optimizer_config = SimpleNamespace(indexing_threshold=self.indexing_threshold)
+        return SimpleNamespace(config=SimpleNamespace(optimizer_config=optimizer_config))
+    
+    async def update_collection(self, collection_name, optimizer_config):
+        threshold = optimizer_config.indexing_threshold
+        if threshold != 0 and self.fail_restore:
+            raise RuntimeError("restore failed")
+        self.threshold_updates.append(threshold)
+        self.indexing_threshold = threshold
+    
+    async def upsert(self, collection_name, points):
+        # Yield so concurrent bulk loads interleave inside the pause
+        await asyncio.sleep(0.01)
+        self.upserts += 1
+
+def make_bulk_vector_store(qdrant_client):
+    """Build a VectorStoreClient that treats every upsert as a bulk load."""
+    client = VectorStoreClient()
+    client._is_initialized = True
+    client.use_qdrant = True
+    client.qdrant_client = qdrant_client
+    client.bulk_upsert_threshold = 1
+    client.default_indexing_threshold = 20000
+    return client
+
+BULK_POINTS = [{"id": 1, "content": "bulk", "embedding": [0.1, 0.2, 0.3], "metadata": {}}]
+
+@pytest.mark.asyncio
+async def test_concurrent_bulk_upserts_restore_indexing():
+    """Overlapping bulk loads pause indexing once and restore the original threshold."""
+    qdrant = StubIndexingQdrantClient(indexing_threshold=10000)
+    client = make_bulk_vector_store(qdrant)
+    
+    results = await asyncio.gather(*(client._upsert_qdrant(BULK_POINTS) for _ in range(3)))
+    
+    assert results == [True, True, True]
+    assert qdrant.upserts == 3
+    assert qdrant.threshold_updates == [0, 10000]
+    assert qdrant.indexing_threshold == 10000
+
+@pytest.mark.asyncio
+async def test_bulk_upsert_restores_default_threshold():
+    """A collection without an explicit threshold gets the configured default back."""
+    qdrant = StubIndexingQdrantClient(indexing_threshold=None)
+    client = make_bulk_vector_store(qdrant)
+    
+    assert await client._upsert_qdrant(BULK_POINTS) is True
+    assert qdrant.indexing_threshold == 20000
+
+@pytest.mark.asyncio
+async def test_bulk_upsert_survives_restore_failure():
+    """Failing to restore the threshold is logged, not reported as a failed upsert."""
+    qdrant = StubIndexingQdrantClient(indexing_threshold=10000, fail_restore=True)
+    client = make_bulk_vector_store(qdrant)
+    
+    assert await client._upsert_qdrant(BULK_POINTS) is True
+    assert qdrant.upserts == 1
+
+class StubUnavailableQdrantClient:
+    """AsyncQdrantClient double whose searches always fail."""
+    
+    def __init__(self):
+        self.search_calls = 0
+    
+    async def search(self, **kwargs):
+        self.search_calls += 1
+        raise ConnectionError("qdrant unavailable")
+
+class StubNeonClient:
+    """NeonClient double returning a fixed vector search result."""
+    
+    async def search_by_vector(self, embedding, limit, similarity_threshold):
+        return [{"id": "neon_hit", "content": "from neon", "similarity": 0.9, "metadata": {}}]
+
+@pytest.mark.asyncio
+async def test_search_falls_back_to_neon_without_retrying():
+    """A failed Qdrant search goes straight to Neon rather than retrying first."""
+    qdrant = StubUnavailableQdrantClient()
+    client = VectorStoreClient(neon_client=StubNeonClient(), qdrant_client=qdrant)
+    client._is_initialized = True
+    client.use_qdrant = True
+    client.qdrant_max_retries = 2
+    
+    results = await client.search(embedding=[0.1, 0.2, 0.3], limit=1)
+    
+    assert qdrant.search_calls == 1
+    assert [result["id"] for result in results] == ["neon_hit"]